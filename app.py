@@ -6,14 +6,17 @@ the messaging layer with the LangGraph agentic loop.
 """
 
 import asyncio
+import json
 import logging
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
 # Load .env into os.environ BEFORE any other imports that read env vars
 load_dotenv()
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, HTTPException, Depends
+from fastapi import FastAPI, Request, HTTPException, Depends, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 from langgraph.types import Command
 
@@ -40,6 +43,11 @@ telegram_client: TelegramClient = None
 graph = None
 checkpointer = None
 
+# Recently handled callback_query ids. A redelivered button update (webhook
+# retry, or a poll that overlaps a restart) must not resume the graph twice.
+SEEN_CALLBACKS_MAX = 256
+_seen_callbacks: OrderedDict[str, None] = OrderedDict()
+
 
 # ==========================================================
 # 1. Lifespan (startup / shutdown)
@@ -157,14 +165,13 @@ async def _poll_telegram():
 
                 logger.info(f"📩 Message from {chat_id}: {text[:100]}")
 
-                # Show typing indicator
-                await telegram_client.send_typing_action(chat_id)
-
                 msg = IncomingMessageEvent(
                     platform="telegram",
                     user_id=str(chat_id),
                     text=text
                 )
+                # Show typing indicator, then queue the run
+                await _send_typing(chat_id)
                 await lane_manager.submit(str(chat_id), worker.agent_daemon, graph, msg)
 
         except asyncio.CancelledError:
@@ -255,15 +262,13 @@ async def webhook(request: Request):
 
         verify_chat_id(chat_id)
 
-        # Show typing indicator
-        await telegram_client.send_typing_action(chat_id)
-
         msg = IncomingMessageEvent(
             platform="telegram",
             user_id=str(chat_id),
             text=text
         )
-        # Run the graph sequentially via LaneManager
+        # Show typing indicator and run the graph sequentially via LaneManager
+        await _send_typing(chat_id)
         await lane_manager.submit(str(chat_id), worker.agent_daemon, graph, msg)
 
         return {"status": "processing"}
@@ -276,6 +281,18 @@ async def webhook(request: Request):
 # 5. Background Handlers
 # ==========================================================
 
+async def _send_typing(chat_id: int) -> None:
+    """
+    Best-effort typing indicator. A failure is logged and swallowed: a 500
+    from /webhook would make Telegram redeliver the update and run the
+    agent twice.
+    """
+    try:
+        await telegram_client.send_typing_action(chat_id)
+    except Exception as e:
+        logger.warning(f"Typing indicator failed for {chat_id}: {e}")
+
+
 async def _handle_callback_query(callback_query: dict):
     """
     Handle inline keyboard button clicks (Approve/Reject/Edit).
@@ -289,6 +306,14 @@ async def _handle_callback_query(callback_query: dict):
     if not data or not chat_id:
         return {"status": "ignored"}
 
+    # Record the id before any await so a concurrent redelivery is dropped too
+    if callback_id in _seen_callbacks:
+        logger.info(f"🔁 Duplicate callback {callback_id} ignored")
+        return {"status": "duplicate"}
+    _seen_callbacks[callback_id] = None
+    if len(_seen_callbacks) > SEEN_CALLBACKS_MAX:
+        _seen_callbacks.popitem(last=False)
+
     # Parse callback data: "approve:thread_id", "reject:thread_id", "edit:thread_id"
     parts = data.split(":", 1)
     decision = parts[0]
@@ -296,11 +321,6 @@ async def _handle_callback_query(callback_query: dict):
 
     logger.info(f"🔘 Callback: {decision} from {chat_id} (thread: {thread_id})")
 
-    # Acknowledge the button press immediately
-    await telegram_client.answer_callback_query(
-        callback_id, text=f"{'✅ Approved' if decision == 'approve' else '❌ Rejected' if decision == 'reject' else '✏️ Editing'}..."
-    )
-
     # Update the original message to show the decision
     decision_text = {
         "approve": "✅ *Approved* — executing...",
@@ -308,10 +328,16 @@ async def _handle_callback_query(callback_query: dict):
         "edit": "✏️ *Editing* — please send your modifications...",
     }.get(decision, "Unknown action")
 
-    await telegram_client.edit_message_text(
-        chat_id=chat_id,
-        message_id=message_id,
-        text=decision_text,
+    # Acknowledge the button press and update the message concurrently
+    await asyncio.gather(
+        telegram_client.answer_callback_query(
+            callback_id, text=f"{'✅ Approved' if decision == 'approve' else '❌ Rejected' if decision == 'reject' else '✏️ Editing'}..."
+        ),
+        telegram_client.edit_message_text(
+            chat_id=chat_id,
+            message_id=message_id,
+            text=decision_text,
+        ),
     )
 
     if decision == "edit":
@@ -371,6 +397,98 @@ async def chat_endpoint(thread_id: str, request: Request):
     return {"status": "queued"}
 
 
+def _merge_tokens(events: list) -> list:
+    """Fold each run of consecutive token events into a single event."""
+    merged = []
+    for event in events:
+        if event["type"] == "token" and merged and merged[-1]["type"] == "token":
+            merged[-1] = {"type": "token", "token": merged[-1]["token"] + event["token"]}
+        else:
+            merged.append(event)
+    return merged
+
+
+def _same_origin(websocket: WebSocket) -> bool:
+    """Whether the handshake comes from a page served by this host (blocks cross-site hijacking)."""
+    origin = websocket.headers.get("origin")
+    host = websocket.headers.get("host")
+    return bool(origin and host) and urlsplit(origin).netloc == host
+
+
+def _log_pump_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception():
+        logger.error("❌ WebSocket sender failed", exc_info=task.exception())
+
+
+@app.websocket("/ws/chat")
+async def chat_socket(websocket: WebSocket):
+    """
+    Persistent web chat channel.
+    Receives turns ({"type": "message"}) and HITL decisions ({"type": "resume"})
+    and pushes the thread's tokens, replies, approval requests and turn ends back.
+    Each send drains everything queued since the previous one into one frame.
+
+    Thread IDs are issued by the server: the first frame carries a
+    {"type": "session"} event, and a reconnect may pass it back as
+    ?thread_id=... to resume the same thread. Unknown IDs get a fresh one.
+    """
+    from interfaces.web_chat import web_client
+
+    if not _same_origin(websocket):
+        logger.warning(f"🚫 Rejected cross-origin WebSocket from {websocket.headers.get('origin')}")
+        await websocket.close(code=1008)
+        return
+
+    thread_id = websocket.query_params.get("thread_id", "")
+    if not web_client.owns(thread_id):
+        thread_id = web_client.new_thread()
+
+    await websocket.accept()
+    queue = web_client.subscribe(thread_id)
+    queue.put_nowait({"type": "session", "thread_id": thread_id})
+
+    async def pump():
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            await websocket.send_text(json.dumps(_merge_tokens(batch), default=str))
+
+    sender = asyncio.create_task(pump())
+    sender.add_done_callback(_log_pump_failure)
+    try:
+        while True:
+            try:
+                data = json.loads(await websocket.receive_text())
+            except ValueError:
+                data = None
+            if not isinstance(data, dict):
+                queue.put_nowait({"type": "error", "error": "Invalid frame: expected a JSON object"})
+                continue
+
+            if not graph:
+                queue.put_nowait({"type": "error", "error": "Graph not initialized"})
+                continue
+
+            if data.get("type") == "resume":
+                decision = data.get("action", "reject")
+                logger.info(f"🌐 WebSocket resume queued: {decision} for thread {thread_id}")
+                msg = ResumeEvent(platform="web", user_id=thread_id, decision=decision)
+                await lane_manager.submit(thread_id, worker.resume_daemon, graph, msg)
+            else:
+                user_input = str(data.get("user_input", "")).strip()
+                if not user_input:
+                    continue
+                logger.info(f"🌐 WebSocket turn queued from {thread_id}: {user_input[:100]}")
+                msg = IncomingMessageEvent(platform="web", user_id=thread_id, text=user_input)
+                await lane_manager.submit(thread_id, worker.agent_daemon, graph, msg)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        web_client.unsubscribe(thread_id, queue)
+
+
 @app.post("/api/v1/chat/{thread_id}/resume")
 async def resume_hitl_endpoint(thread_id: str, request: Request):
     """
@@ -433,4 +551,5 @@ async def system_notify_endpoint(thread_id: str, request: Request):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True)
+    # Keep idle connections open across chat turns (uvicorn's default is 5s)
+    uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True, timeout_keep_alive=75)
@@ -26,6 +26,23 @@ class ChannelManager:
         else:
             logger.error(f"❌ Unknown platform '{platform}', cannot send message to thread {thread_id}")
 
+    def supports_streaming(self, platform: str) -> bool:
+        """Whether the platform's client renders partial LLM output."""
+        client = self.clients.get(platform)
+        return bool(client and client.supports_streaming)
+
+    async def stream_token(self, platform: str, thread_id: str, token: str):
+        """Route a partial LLM token to platforms that render streaming output."""
+        client = self.clients.get(platform)
+        if client and client.supports_streaming:
+            await client.stream_token(thread_id, token)
+
+    async def end_turn(self, platform: str, thread_id: str):
+        """Tell the platform that a user turn has finished."""
+        client = self.clients.get(platform)
+        if client:
+            await client.end_turn(thread_id)
+
     async def request_approval(self, platform: str, thread_id: str, tool_name: str, args: dict):
         """Route an approval request (HITL buttons) to the appropriate platform."""
         client = self.clients.get(platform)
@@ -1,11 +1,31 @@
 import logging
 import asyncio
 
+from langchain_core.messages import AIMessageChunk
+from langgraph.types import Command
+
 from core.messaging import IncomingMessageEvent, ResumeEvent, SystemEvent
 from core.channel_manager import channel_manager
 
 logger = logging.getLogger("core.worker")
 
+def _stream_modes(platform: str) -> list:
+    """Add LangGraph's token stream only for channels that can render partial output."""
+    if channel_manager.supports_streaming(platform):
+        return ["updates", "messages"]
+    return ["updates"]
+
+async def _forward_token(platform: str, thread_id: str, data) -> None:
+    """Push text deltas produced by the agent node's LLM to the channel."""
+    chunk, metadata = data
+    if metadata.get("langgraph_node") != "agent" or not isinstance(chunk, AIMessageChunk):
+        return
+    content = chunk.content
+    if isinstance(content, list):
+        content = "".join(item.get("text", "") for item in content if isinstance(item, dict))
+    if content:
+        await channel_manager.stream_token(platform, thread_id, content)
+
 async def agent_daemon(graph, event: IncomingMessageEvent) -> dict:
     """
     Unified LangGraph runner for the Event Bus.
@@ -13,16 +33,19 @@ async def agent_daemon(graph, event: IncomingMessageEvent) -> dict:
     config = {"configurable": {"thread_id": event.user_id, "platform": event.platform}}
 
     try:
-        async for graph_event in graph.astream(
+        async for mode, graph_event in graph.astream(
             {
                 "chat_id": event.user_id,
                 "user_input": event.text,
                 "tool_failure_count": 0,
             },
             config=config,
-            stream_mode="updates",
+            stream_mode=_stream_modes(event.platform),
         ):
-            logger.debug(f"Graph event ({event.platform}): {graph_event}")
+            if mode == "messages":
+                await _forward_token(event.platform, event.user_id, graph_event)
+            else:
+                logger.debug(f"Graph event ({event.platform}): {graph_event}")
 
         state = await graph.aget_state(config)
 
@@ -81,6 +104,8 @@ async def agent_daemon(graph, event: IncomingMessageEvent) -> dict:
             logger.critical(f"FATAL: Channel manager failed to deliver error for thread {event.user_id}")
             # (Optional: push to a Redis dead-letter queue here)
         return {"error": str(e)[:500]}
+    finally:
+        await channel_manager.end_turn(event.platform, event.user_id)
 
 
 async def resume_daemon(graph, event: ResumeEvent) -> dict:
@@ -89,12 +114,15 @@ async def resume_daemon(graph, event: ResumeEvent) -> dict:
     """
     config = {"configurable": {"thread_id": event.user_id, "platform": event.platform}}
     try:
-        async for graph_event in graph.astream(
+        async for mode, graph_event in graph.astream(
             Command(resume=event.decision),
             config=config,
-            stream_mode="updates",
+            stream_mode=_stream_modes(event.platform),
         ):
-            logger.debug(f"Resume event ({event.platform}): {graph_event}")
+            if mode == "messages":
+                await _forward_token(event.platform, event.user_id, graph_event)
+            else:
+                logger.debug(f"Resume event ({event.platform}): {graph_event}")
 
         state = await graph.aget_state(config)
         if not state.next:
@@ -124,6 +152,8 @@ async def resume_daemon(graph, event: ResumeEvent) -> dict:
         logger.error(f"❌ Resume error ({event.platform}): {e}", exc_info=True)
         await channel_manager.send_message(event.platform, event.user_id, f"❌ Error resuming action:\n`{str(e)[:500]}`")
         return {"error": str(e)[:500]}
+    finally:
+        await channel_manager.end_turn(event.platform, event.user_id)
 
 async def system_daemon(graph, event: SystemEvent) -> dict:
     """
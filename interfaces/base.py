@@ -9,6 +9,9 @@ class ClientInterface(ABC):
     Abstract base class for all EnterpriseClaw input/output clients.
     Decouples the LangGraph execution engine from the delivery mechanism.
     """
+
+    # Clients that can render partial output set this so the worker streams LLM tokens to them.
+    supports_streaming: bool = False
     
     @abstractmethod
     async def send_message(self, thread_id: str, content: str) -> None:
@@ -32,3 +35,24 @@ class ClientInterface(ABC):
             args: The exact arguments the LLM wants to execute the tool with.
         """
         pass
+
+    async def stream_token(self, thread_id: str, token: str) -> None:
+        """
+        Pushes a partial LLM token while a reply is still being generated.
+        Optional — only called for clients with `supports_streaming = True`.
+        
+        Args:
+            thread_id: The unique identifier for the conversation/user.
+            token: The next text delta of the reply.
+        """
+        pass
+
+    async def end_turn(self, thread_id: str) -> None:
+        """
+        Signals that a user turn has finished, whether or not it produced a
+        message (replies such as HEARTBEAT_OK are suppressed). Optional.
+        
+        Args:
+            thread_id: The unique identifier for the conversation/user.
+        """
+        pass
@@ -14,6 +14,57 @@ from interfaces.base import ClientInterface
 logger = logging.getLogger(__name__)
 
 TELEGRAM_API = "https://api.telegram.org/bot{token}"
+JSON_HEADERS = {"Content-Type": "application/json"}
+POLL_TIMEOUT = 30  # seconds Telegram holds a getUpdates request open
+
+# orjson is a faster drop-in for the request/response bodies; fall back to stdlib json
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(payload: dict) -> bytes:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+def _utf16_chunks(text: str, limit: int = 4096) -> list[str]:
+    """
+    Split text into chunks of at most `limit` UTF-16 code units — the unit
+    Telegram measures message length in, so emoji/CJK count correctly.
+    Each window breaks on its last newline (or failing that, space) so words
+    and Markdown entities are not cut in half, and never inside a surrogate pair.
+    """
+    # Below two units a window could not hold a surrogate pair and would never advance
+    if limit < 2:
+        raise ValueError(f"limit must be at least 2 UTF-16 units, got {limit}")
+    if len(text) * 2 <= limit:  # a code point is at most 2 UTF-16 units
+        return [text]
+
+    data = text.encode("utf-16-le")
+    stride = limit * 2
+    chunks = []
+    start = 0
+    while len(data) - start > stride:
+        end = start + stride
+        # Back off one unit if the boundary lands on a low surrogate
+        if 0xDC <= data[end + 1] <= 0xDF:
+            end -= 2
+        window = data[start:end].decode("utf-16-le")
+        cut = window.rfind("\n")
+        if cut <= 0:
+            cut = window.rfind(" ")
+        # Keep the separator with the preceding chunk; hard-cut if there is none
+        if cut > 0:
+            window = window[: cut + 1]
+        chunks.append(window)
+        start += len(window.encode("utf-16-le"))
+    chunks.append(data[start:].decode("utf-16-le"))
+    return chunks
 
 
 class TelegramClient(ClientInterface):
@@ -22,24 +73,28 @@ class TelegramClient(ClientInterface):
     def __init__(self, token: str):
         self.token = token
         self.base_url = TELEGRAM_API.format(token=token)
-        self._client: Optional[httpx.AsyncClient] = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        # httpx clients can be built outside the event loop, so create them
+        # up front instead of awaiting a lazy getter on every call.
+        self._client = httpx.AsyncClient(timeout=30.0)
+        # Long-polling gets its own single-connection pool so a pending
+        # getUpdates never holds a connection that sendMessage needs.
+        self._poll_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(POLL_TIMEOUT + 10, connect=5),
+            limits=httpx.Limits(max_connections=1, max_keepalive_connections=1, keepalive_expiry=120),
+        )
 
     async def close(self):
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        for client in (self._client, self._poll_client):
+            if not client.is_closed:
+                await client.aclose()
 
     async def _call(self, method: str, **kwargs) -> dict:
         """Make a Telegram Bot API call."""
-        client = await self._get_client()
         url = f"{self.base_url}/{method}"
-        resp = await client.post(url, json=kwargs)
-        resp.raise_for_status()
-        data = resp.json()
+        resp = await self._client.post(url, content=_json_dumps(kwargs), headers=JSON_HEADERS)
+        if resp.status_code >= 400:
+            raise httpx.HTTPStatusError(f"HTTP {resp.status_code}", request=resp.request, response=resp)
+        data = _json_loads(resp.content)
         if not data.get("ok"):
             logger.error(f"Telegram API error: {data}")
         return data
@@ -65,23 +120,11 @@ class TelegramClient(ClientInterface):
         parse_mode: Optional[str] = "HTML",
         reply_markup: Optional[dict] = None,
     ) -> dict:
-        """Send a text message. Splits into chunks if > 4096 chars."""
+        """Send a text message. Splits into chunks if > 4096 UTF-16 code units."""
         MAX_LEN = 4096
-        if len(text) <= MAX_LEN:
-            kwargs = {"chat_id": chat_id, "text": text, "parse_mode": parse_mode}
-            if reply_markup:
-                kwargs["reply_markup"] = reply_markup
-            try:
-                return await self._call("sendMessage", **kwargs)
-            except httpx.HTTPStatusError as e:
-                if parse_mode and e.response.status_code == 400:
-                    logger.warning(f"Parse failed, retrying without parse_mode: {e}")
-                    kwargs.pop("parse_mode", None)
-                    return await self._call("sendMessage", **kwargs)
-                raise
+        chunks = _utf16_chunks(text, MAX_LEN)
 
-        # Split long messages
-        chunks = [text[i : i + MAX_LEN] for i in range(0, len(text), MAX_LEN)]
+        # Chunks go out one at a time: concurrent sends would arrive out of order.
         result = None
         for i, chunk in enumerate(chunks):
             kwargs = {"chat_id": chat_id, "text": chunk, "parse_mode": parse_mode}
@@ -92,7 +135,7 @@ class TelegramClient(ClientInterface):
                 result = await self._call("sendMessage", **kwargs)
             except httpx.HTTPStatusError as e:
                 if parse_mode and e.response.status_code == 400:
-                    logger.warning(f"Parse failed for chunk, retrying without parse_mode: {e}")
+                    logger.warning(f"Parse failed, retrying without parse_mode: {e}")
                     kwargs.pop("parse_mode", None)
                     result = await self._call("sendMessage", **kwargs)
                 else:
@@ -168,22 +211,23 @@ class TelegramClient(ClientInterface):
         """Remove any existing webhook so polling works."""
         return await self._call("deleteWebhook")
 
-    async def get_updates(self, offset: int = 0, timeout: int = 30) -> list[dict]:
+    async def get_updates(self, offset: int = 0, timeout: int = POLL_TIMEOUT) -> list[dict]:
         """
         Long-poll for updates from Telegram.
         Uses a longer httpx timeout since the Telegram long-poll itself takes `timeout` seconds.
         """
         try:
-            client = await self._get_client()
             url = f"{self.base_url}/getUpdates"
             # httpx timeout must be longer than Telegram's long-poll timeout
-            resp = await client.post(
+            resp = await self._poll_client.post(
                 url,
-                json={"offset": offset, "timeout": timeout},
-                timeout=timeout + 10,
+                content=_json_dumps({"offset": offset, "timeout": timeout}),
+                headers=JSON_HEADERS,
+                timeout=httpx.Timeout(timeout + 10, connect=5),
             )
-            resp.raise_for_status()
-            data = resp.json()
+            if resp.status_code >= 400:
+                raise httpx.HTTPStatusError(f"HTTP {resp.status_code}", request=resp.request, response=resp)
+            data = _json_loads(resp.content)
             return data.get("result", [])
         except Exception as e:
             logger.error(f"Polling error: {e}")
@@ -4,51 +4,270 @@ web_chat.py — Localhost web chat interface for EnterpriseClaw.
 Provides a beautiful single-page chat UI served at /chat that
 communicates with the same LangGraph pipeline used by Telegram.
 
-API endpoints are defined in app.py — this module only serves the HTML.
+API endpoints are defined in app.py — this module serves the HTML and its
+fingerprinted CSS/JS/font assets, and holds the WebClient that feeds the
+/ws/chat WebSocket.
 """
 
-from fastapi import APIRouter
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import HTMLResponse, Response
+import base64
+import gzip
+import hashlib
 import logging
+import re
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional — gzip is always available
+    brotli = None
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def _strip_css(css: str) -> str:
+    """Dependency-free CSS squeeze: comments and whitespace around punctuation."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def _strip_js(js: str) -> str:
+    """
+    Line-wise squeeze for CHAT_JS: drops indentation, blank lines and
+    whole-line // comments. Line breaks are kept so automatic semicolon
+    insertion is untouched, and the script keeps every template literal on
+    one line, so no string contents can change.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def _strip_markup(html: str) -> str:
+    """
+    Dependency-free squeeze for this page's markup (including inline SVG):
+    drops comments and collapses line-break indentation. The page has no
+    <pre> or prefilled <textarea> whose whitespace would matter.
+    """
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    html = re.sub(r">\s*\n\s*<", "><", html)
+    html = re.sub(r"\s*\n\s*", " ", html)
+    return html.strip()
+
+
+def _minify(content: str, wrapper: str | None = None) -> str:
+    """
+    Minify an HTML document once at import, or a bare stylesheet or script
+    when `wrapper` is "style" or "script". Stdlib only, so it runs in every
+    install.
+    """
+    if wrapper == "style":
+        return _strip_css(content)
+    if wrapper == "script":
+        return _strip_js(content)
+    return _strip_markup(content)
+
+
+class _PrebuiltResponse(Response):
+    """
+    A Response whose body and encoded header list were built ahead of time,
+    skipping Starlette's per-request header construction.
+    """
+
+    def __init__(self, status_code: int, body: bytes, raw_headers: list):
+        self.status_code = status_code
+        self.body = body
+        self.background = None
+        # Copied because middleware may append to the list in place
+        self.raw_headers = list(raw_headers)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match comparison per RFC 9110: "*" or any listed tag, compared
+    weakly (a W/ prefix, e.g. added by a compressing proxy, is ignored).
+    """
+    if if_none_match == etag:
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class _StaticAsset:
+    """
+    An in-memory static payload that is encoded, compressed and hashed once
+    at import, then served with content negotiation and ETag revalidation.
+    Every (encoding, status) response is precomputed as a body + raw headers.
+    """
+
+    def __init__(
+        self,
+        content: str | bytes,
+        media_type: str,
+        cache_control: str,
+        compress: bool = True,
+        link: str | None = None,
+    ):
+        self.body = content.encode("utf-8") if isinstance(content, str) else content
+        self.media_type = media_type
+        self.cache_control = cache_control
+        # Link header for the 200; CDNs that support it replay it as 103 Early Hints
+        self.link = link
+        # Already-compressed formats (WOFF2) are served as-is
+        self.gzip = gzip.compress(self.body, 9) if compress else None
+        self.br = brotli.compress(self.body, quality=11) if brotli and compress else None
+        self.digest = hashlib.blake2b(self.body, digest_size=16).hexdigest()
+        # Subresource Integrity value for <link>/<script integrity="...">
+        self.integrity = "sha384-" + base64.b64encode(hashlib.sha384(self.body).digest()).decode()
+        self._variants = {
+            encoding: self._variant(body, encoding)
+            for encoding, body in (("br", self.br), ("gzip", self.gzip), (None, self.body))
+            if body is not None
+        }
+
+    def _variant(self, body: bytes, encoding: str | None) -> tuple:
+        """(etag, body, 200 headers, 304 headers) for one content-coding."""
+        # Each content-coding is a different representation, so it gets its own strong ETag
+        etag = f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+        common = [
+            (b"cache-control", self.cache_control.encode()),
+            (b"vary", b"Accept-Encoding"),
+            (b"etag", etag.encode()),
+        ]
+        full = [
+            (b"content-length", str(len(body)).encode()),
+            (b"content-type", self.media_type.encode()),
+            *common,
+        ]
+        if encoding:
+            full.append((b"content-encoding", encoding.encode()))
+        if self.link:
+            full.append((b"link", self.link.encode()))
+        return etag, body, full, common
+
+    def respond(self, request: Request) -> Response:
+        accept = request.headers.get("accept-encoding", "")
+        if self.br and "br" in accept:
+            encoding = "br"
+        elif self.gzip and "gzip" in accept:
+            encoding = "gzip"
+        else:
+            encoding = None
+
+        etag, body, headers, not_modified_headers = self._variants[encoding]
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return _PrebuiltResponse(304, b"", not_modified_headers)
+        return _PrebuiltResponse(200, body, headers)
+
+
 @router.get("/chat", response_class=HTMLResponse)
-async def serve_chat():
-    return HTMLResponse(CHAT_HTML)
+async def serve_chat(request: Request):
+    """Serve the chat page from buffers compressed once at import."""
+    return CHAT_PAGE.respond(request)
+
+
+@router.get("/chat/assets/{name}")
+async def serve_chat_asset(name: str, request: Request):
+    """Serve fingerprinted CSS/JS/fonts; the hash in the name makes them immutable."""
+    asset = CHAT_ASSETS.get(name)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    return asset.respond(request)
 
 from interfaces.base import ClientInterface
-from typing import Dict, Any
+from collections import OrderedDict, defaultdict
+from typing import Dict, Any, Set, Tuple
+import asyncio
+import secrets
+import time
+
+# How long a thread ID with no open socket can still be reattached to
+THREAD_TTL = 3600  # seconds
 
 class WebClient(ClientInterface):
     """
     Adapter for the local Web GUI.
-    Currently just logs output so the frontend can poll it, 
-    but designed to be extended with WebSockets or SSEs.
+    Fans every outgoing event out to the browser tabs subscribed to a
+    thread; app.py relays each subscription over the /ws/chat WebSocket.
     """
+    supports_streaming = True
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        # Thread IDs handed out to browsers, oldest first, with the time each
+        # was issued or last lost its final subscriber; sockets may only
+        # attach to these (or to a thread that still has subscribers)
+        self._threads: OrderedDict[str, float] = OrderedDict()
+
+    def new_thread(self) -> str:
+        """Issue an unguessable web thread ID."""
+        self._expire_threads()
+        thread_id = "web_" + secrets.token_urlsafe(16)
+        self._threads[thread_id] = time.monotonic()
+        return thread_id
+
+    def owns(self, thread_id: str) -> bool:
+        if thread_id in self._subscribers:
+            return True
+        seen = self._threads.get(thread_id)
+        return seen is not None and time.monotonic() - seen < THREAD_TTL
+
+    def _expire_threads(self) -> None:
+        """Forget IDs idle past THREAD_TTL; attached threads are re-stamped on detach."""
+        cutoff = time.monotonic() - THREAD_TTL
+        while self._threads:
+            thread_id, seen = next(iter(self._threads.items()))
+            if seen >= cutoff:
+                break
+            del self._threads[thread_id]
+
+    def subscribe(self, thread_id: str) -> asyncio.Queue:
+        queue = asyncio.Queue()
+        self._subscribers[thread_id].add(queue)
+        return queue
+
+    def unsubscribe(self, thread_id: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(thread_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[thread_id]
+                # Reconnects may reattach for THREAD_TTL, then the ID expires
+                self._threads[thread_id] = time.monotonic()
+                self._threads.move_to_end(thread_id)
+
+    def _publish(self, thread_id: str, event: Dict[str, Any]) -> None:
+        for queue in self._subscribers.get(thread_id, ()):
+            queue.put_nowait(event)
+
     async def send_message(self, thread_id: str, content: str) -> None:
-        # TODO: Upgrade to use FastAPI's StreamingResponse (Server-Sent Events) or WebSockets
-        # to instantly push the message (e.g. 🔔 **[Subagent Report]**) to the browser.
-        # In a real app, this would push via WebSocket to `thread_id`
         logger.info(f"🖥️ [WEB OUT] {thread_id}: {content[:100]}")
+        self._publish(thread_id, {"type": "message", "content": content})
 
     async def request_approval(self, thread_id: str, tool_name: str, args: Dict[str, Any]) -> None:
         logger.info(f"🖥️ [WEB HITL] {thread_id} needs approval for {tool_name}")
+        self._publish(thread_id, {"type": "approval", "action": tool_name, "tool_args": args})
+
+    async def stream_token(self, thread_id: str, token: str) -> None:
+        self._publish(thread_id, {"type": "token", "token": token})
+
+    async def end_turn(self, thread_id: str) -> None:
+        self._publish(thread_id, {"type": "done"})
 
 web_client = WebClient()
 
-CHAT_HTML = r"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>EnterpriseClaw — Chat</title>
-<link rel="preconnect" href="https://fonts.googleapis.com">
-<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Cinzel:wght@400;600;700&display=swap" rel="stylesheet">
-<style>
+CHAT_CSS = r"""
   *, *::before, *::after { box-sizing: border-box; margin: 0; padding: 0; }
 
   :root {
@@ -98,6 +317,7 @@ CHAT_HTML = r"""
     width: 100%;
     height: 100%;
     z-index: 0;
+    object-fit: cover;
     pointer-events: none;
     opacity: 0.6;
   }
@@ -192,7 +412,7 @@ CHAT_HTML = r"""
     font-weight: 500;
     color: var(--text-secondary);
     cursor: pointer;
-    transition: all 0.2s;
+    transition: background-color 0.2s, color 0.2s;
     letter-spacing: 0.3px;
   }
   .sidebar-nav-item:hover {
@@ -238,7 +458,9 @@ CHAT_HTML = r"""
     height: 6px;
     background: var(--success);
     border-radius: 50%;
-    animation: pulse 2s ease-in-out infinite;
+  }
+  @media (prefers-reduced-motion: no-preference) {
+    .sidebar-status::before { animation: pulse 2s ease-in-out infinite; }
   }
   @keyframes pulse {
     0%, 100% { opacity: 1; }
@@ -313,6 +535,22 @@ CHAT_HTML = r"""
     scroll-behavior: smooth;
   }
 
+  /* Pin to bottom: the browser anchors on the sentinel, so growing
+     content keeps the view at the end without a JS scroll write */
+  .messages > * { overflow-anchor: none; }
+  /* Stand-ins for unmounted rows; the negative margins absorb the flex gap
+     so an empty spacer takes no room */
+  .messages > .spacer { flex-shrink: 0; height: 0; }
+  .messages > .spacer.top { margin-bottom: -16px; }
+  .messages > .spacer.bottom { margin-top: -16px; }
+
+  .messages > .scroll-anchor {
+    overflow-anchor: auto;
+    flex-shrink: 0;
+    height: 1px;
+    margin-top: -16px; /* cancel the flex gap */
+  }
+
   /* Scrollbar */
   .messages::-webkit-scrollbar { width: 4px; }
   .messages::-webkit-scrollbar-track { background: transparent; }
@@ -340,6 +578,14 @@ CHAT_HTML = r"""
     to   { opacity: 1; transform: translateY(0); }
   }
 
+  /* Skip layout and paint for rows scrolled out of view. "auto" makes the
+     browser remember each row's last rendered size, so the scrollbar and
+     the transcript window's cached heights stay accurate. */
+  .msg, .hitl-card {
+    content-visibility: auto;
+    contain-intrinsic-size: auto 0 auto 120px;
+  }
+
   .msg.user {
     align-self: flex-end;
     background: rgba(201, 168, 76, 0.10);
@@ -348,14 +594,18 @@ CHAT_HTML = r"""
     color: var(--text-primary);
   }
 
-  .msg.bot {
+  /* Light card surface shared by bot replies, the typing indicator and
+     HITL cards; each rule below only adds what differs */
+  .msg.bot, .typing, .hitl-card {
     align-self: flex-start;
-    background: rgba(255, 255, 255, 0.55);
+    background: rgba(255, 255, 255, 0.85);
     border: 1px solid rgba(201, 168, 76, 0.12);
+    border-radius: 18px;
+  }
+
+  .msg.bot {
     border-bottom-left-radius: 6px;
     color: var(--text-primary);
-    backdrop-filter: blur(8px);
-    -webkit-backdrop-filter: blur(8px);
   }
 
   .msg.bot .msg-name {
@@ -401,11 +651,7 @@ CHAT_HTML = r"""
   /* ─── Typing indicator ─────────────────────────────── */
   .typing {
     display: none;
-    align-self: flex-start;
     padding: 14px 20px;
-    background: rgba(255, 255, 255, 0.50);
-    border: 1px solid rgba(201, 168, 76, 0.12);
-    border-radius: 18px;
     border-bottom-left-radius: 6px;
   }
   .typing.show { display: block; }
@@ -419,8 +665,17 @@ CHAT_HTML = r"""
     height: 6px;
     background: var(--gold-matte);
     border-radius: 50%;
-    animation: dotPulse 1.4s ease-in-out infinite;
   }
+  /* Only pulse (and hold GPU layers) while the indicator is visible */
+  @media (prefers-reduced-motion: no-preference) {
+    .typing.show .typing-dots span {
+      animation: dotPulse 1.4s ease-in-out infinite;
+      will-change: transform, opacity;
+    }
+  }
+  /* Set while the tab is in the background */
+  .tab-hidden .sidebar-status::before,
+  .tab-hidden .typing-dots span { animation-play-state: paused; }
   .typing-dots span:nth-child(2) { animation-delay: 0.2s; }
   .typing-dots span:nth-child(3) { animation-delay: 0.4s; }
   @keyframes dotPulse {
@@ -430,15 +685,10 @@ CHAT_HTML = r"""
 
   /* ─── HITL Approval ────────────────────────────────── */
   .hitl-card {
-    align-self: flex-start;
     max-width: 72%;
-    background: rgba(255, 255, 255, 0.55);
-    border: 1px solid rgba(201, 168, 76, 0.18);
-    border-radius: 18px;
+    border-color: rgba(201, 168, 76, 0.18);
     padding: 20px;
     animation: fadeUp 0.3s ease;
-    backdrop-filter: blur(8px);
-    -webkit-backdrop-filter: blur(8px);
   }
 
   .hitl-card .hitl-title {
@@ -468,13 +718,14 @@ CHAT_HTML = r"""
   }
 
   .hitl-btn {
+    position: relative;
     padding: 8px 22px;
     border-radius: 10px;
     font-size: 12px;
     font-weight: 600;
     cursor: pointer;
     border: none;
-    transition: all 0.2s;
+    transition: transform 0.2s, opacity 0.2s;
     letter-spacing: 0.3px;
   }
 
@@ -482,7 +733,18 @@ CHAT_HTML = r"""
     background: var(--success);
     color: #fff;
   }
-  .hitl-btn.approve:hover { box-shadow: 0 4px 16px rgba(22, 163, 74, 0.25); }
+  /* Hover glow is painted once on a pseudo-element and faded with opacity */
+  .hitl-btn.approve::after {
+    content: '';
+    position: absolute;
+    inset: 0;
+    border-radius: inherit;
+    box-shadow: 0 4px 16px rgba(22, 163, 74, 0.25);
+    opacity: 0;
+    transition: opacity 0.2s;
+    pointer-events: none;
+  }
+  .hitl-btn.approve:hover::after { opacity: 1; }
 
   .hitl-btn.reject {
     background: transparent;
@@ -512,37 +774,64 @@ CHAT_HTML = r"""
     align-items: center;
     gap: 12px;
     padding: 8px 8px 8px 20px;
-    background: rgba(200, 198, 190, 0.35);
+    /* Opaque enough to read over the transcript without a backdrop blur;
+       only .main-panel samples what is behind it */
+    background: rgba(200, 198, 190, 0.85);
     border: 1px solid rgba(201, 168, 76, 0.15);
     border-radius: 50px;
-    backdrop-filter: blur(30px) saturate(1.3);
-    -webkit-backdrop-filter: blur(30px) saturate(1.3);
     box-shadow:
       0 4px 24px rgba(0, 0, 0, 0.04),
       inset 0 1px 0 rgba(255, 255, 255, 0.50);
-    transition: border-color 0.25s, box-shadow 0.25s;
+    transition: border-color 0.25s;
+    position: relative;
+  }
+  /* Focus ring, pre-painted and faded in with opacity */
+  .input-glass::after {
+    content: '';
+    position: absolute;
+    inset: -1px;
+    border-radius: inherit;
+    box-shadow: 0 0 0 3px rgba(201, 168, 76, 0.06);
+    opacity: 0;
+    transition: opacity 0.25s;
+    pointer-events: none;
   }
   .input-glass:focus-within {
     border-color: rgba(201, 168, 76, 0.35);
-    box-shadow:
-      0 4px 24px rgba(0, 0, 0, 0.04),
-      0 0 0 3px rgba(201, 168, 76, 0.06),
-      inset 0 1px 0 rgba(255, 255, 255, 0.50);
   }
+  .input-glass:focus-within::after { opacity: 1; }
 
-  .input-field {
+  /* Auto-growing textarea: a hidden copy of its text in ::after sizes the
+     shared grid cell, so layout resizes it without JS measuring */
+  .input-grow {
     flex: 1;
-    background: transparent;
-    border: none;
+    min-width: 0;
+    display: grid;
+  }
+  .input-grow::after {
+    content: attr(data-replicated-value) " ";
+    white-space: pre-wrap;
+    word-wrap: break-word;
+    visibility: hidden;
+    overflow: hidden;
+  }
+  .input-grow > .input-field,
+  .input-grow::after {
+    grid-area: 1 / 1 / 2 / 2;
     padding: 10px 0;
     font-size: 14px;
     font-family: var(--font-body);
+    line-height: 1.5;
+    max-height: 100px;
+    min-height: 24px;
+  }
+
+  .input-field {
+    background: transparent;
+    border: none;
     color: var(--text-primary);
     outline: none;
     resize: none;
-    max-height: 100px;
-    min-height: 24px;
-    line-height: 1.5;
   }
   .input-field::placeholder {
     color: var(--text-dim);
@@ -561,7 +850,7 @@ CHAT_HTML = r"""
     justify-content: center;
     font-size: 16px;
     color: var(--text-inverse);
-    transition: all 0.2s;
+    transition: transform 0.2s, opacity 0.2s;
     flex-shrink: 0;
   }
   .send-btn:hover {
@@ -589,7 +878,7 @@ CHAT_HTML = r"""
     margin: 0 auto 20px;
     position: relative;
   }
-  .welcome-yantra svg {
+  .welcome-yantra img {
     width: 100%;
     height: 100%;
   }
@@ -632,336 +921,504 @@ CHAT_HTML = r"""
     .msg { max-width: 90%; }
     .hitl-card { max-width: 90%; }
   }
-</style>
-</head>
-<body>
-
-<!-- ═══ YANTRA SVG BACKGROUND ═══ -->
-<svg class="yantra-bg" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 1000" preserveAspectRatio="xMidYMid slice">
-  <defs>
-    <style>
-      .yl { fill: none; stroke: #c9a84c; stroke-width: 0.5; opacity: 0.25; }
-      .yl2 { fill: none; stroke: #c9a84c; stroke-width: 0.3; opacity: 0.15; }
-      .yl3 { fill: none; stroke: #c9a84c; stroke-width: 0.8; opacity: 0.12; }
-    </style>
-  </defs>
-
-  <!-- Outer circle (Bhupura gate) -->
-  <circle class="yl3" cx="500" cy="500" r="420"/>
-  <circle class="yl2" cx="500" cy="500" r="400"/>
-  <circle class="yl2" cx="500" cy="500" r="380"/>
-
-  <!-- Lotus petals — outer ring (16 petals) -->
-  <g class="yl2">
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(0, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(22.5, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(45, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(67.5, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(90, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(112.5, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(135, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(157.5, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(180, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(202.5, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(225, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(247.5, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(270, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(292.5, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(315, 500, 500)"/>
-    <ellipse cx="500" cy="110" rx="28" ry="60" transform="rotate(337.5, 500, 500)"/>
-  </g>
-
-  <!-- Inner lotus petals (8 petals) -->
-  <g class="yl">
-    <ellipse cx="500" cy="200" rx="22" ry="50" transform="rotate(0, 500, 500)"/>
-    <ellipse cx="500" cy="200" rx="22" ry="50" transform="rotate(45, 500, 500)"/>
-    <ellipse cx="500" cy="200" rx="22" ry="50" transform="rotate(90, 500, 500)"/>
-    <ellipse cx="500" cy="200" rx="22" ry="50" transform="rotate(135, 500, 500)"/>
-    <ellipse cx="500" cy="200" rx="22" ry="50" transform="rotate(180, 500, 500)"/>
-    <ellipse cx="500" cy="200" rx="22" ry="50" transform="rotate(225, 500, 500)"/>
-    <ellipse cx="500" cy="200" rx="22" ry="50" transform="rotate(270, 500, 500)"/>
-    <ellipse cx="500" cy="200" rx="22" ry="50" transform="rotate(315, 500, 500)"/>
-  </g>
-
-  <!-- Sri Yantra triangles — downward (Shakti) -->
-  <polygon class="yl" points="500,180 280,700 720,700"/>
-  <polygon class="yl2" points="500,220 310,660 690,660"/>
-  <polygon class="yl2" points="500,260 340,620 660,620"/>
-  <polygon class="yl2" points="500,300 365,585 635,585"/>
-
-  <!-- Sri Yantra triangles — upward (Shiva) -->
-  <polygon class="yl" points="500,820 280,300 720,300"/>
-  <polygon class="yl2" points="500,780 310,340 690,340"/>
-  <polygon class="yl2" points="500,740 340,380 660,380"/>
-  <polygon class="yl2" points="500,700 365,415 635,415"/>
-
-  <!-- Inner concentric circles -->
-  <circle class="yl" cx="500" cy="500" r="200"/>
-  <circle class="yl2" cx="500" cy="500" r="160"/>
-  <circle class="yl2" cx="500" cy="500" r="120"/>
-  <circle class="yl" cx="500" cy="500" r="60"/>
-
-  <!-- Bindu (center point) -->
-  <circle cx="500" cy="500" r="4" fill="#c9a84c" opacity="0.2"/>
-
-  <!-- Decorative corner motifs -->
-  <g class="yl2">
-    <!-- Top-left -->
-    <line x1="20" y1="20" x2="120" y2="20"/>
-    <line x1="20" y1="20" x2="20" y2="120"/>
-    <path d="M 20,20 Q 60,60 20,120"/>
-    <!-- Top-right -->
-    <line x1="980" y1="20" x2="880" y2="20"/>
-    <line x1="980" y1="20" x2="980" y2="120"/>
-    <path d="M 980,20 Q 940,60 980,120"/>
-    <!-- Bottom-left -->
-    <line x1="20" y1="980" x2="120" y2="980"/>
-    <line x1="20" y1="980" x2="20" y2="880"/>
-    <path d="M 20,980 Q 60,940 20,880"/>
-    <!-- Bottom-right -->
-    <line x1="980" y1="980" x2="880" y2="980"/>
-    <line x1="980" y1="980" x2="980" y2="880"/>
-    <path d="M 980,980 Q 940,940 980,880"/>
-  </g>
-
-  <!-- Subtle diamond grid overlay -->
-  <g class="yl2" opacity="0.4">
-    <line x1="500" y1="0" x2="500" y2="1000"/>
-    <line x1="0" y1="500" x2="1000" y2="500"/>
-    <line x1="0" y1="0" x2="1000" y2="1000"/>
-    <line x1="1000" y1="0" x2="0" y2="1000"/>
-  </g>
-</svg>
-
-<div class="shell">
-  <!-- ═══ SIDEBAR ═══ -->
-  <aside class="sidebar">
-    <div class="sidebar-logo">
-      <div class="sidebar-logo-icon">⚡</div>
-      <div class="sidebar-logo-title" style="font-size: 16px;">EnterpriseClaw</div>
-      <div class="sidebar-logo-sub">Production Agent</div>
-    </div>
-
-    <div class="sidebar-divider"></div>
-
-    <nav class="sidebar-nav">
-      <div class="sidebar-nav-item active">
-        <span class="nav-icon">◈</span>
-        Chat
-      </div>
-      <div class="sidebar-nav-item">
-        <span class="nav-icon">◇</span>
-        Memory
-      </div>
-      <div class="sidebar-nav-item">
-        <span class="nav-icon">△</span>
-        Skills
-      </div>
-    </nav>
-
-    <div class="sidebar-footer">
-      <div class="sidebar-status">Online</div>
-      <div class="sidebar-footer-text">Powered by Gemini</div>
-    </div>
-  </aside>
-
-  <!-- ═══ MAIN PANEL ═══ -->
-  <main class="main-panel">
-    <!-- Panel Header -->
-    <div class="panel-header">
-      <span class="panel-header-title">Chat</span>
-      <span class="panel-header-line"></span>
-    </div>
-
-    <!-- Messages -->
-    <div class="messages" id="messages">
-      <div class="welcome" id="welcome">
-        <div class="welcome-yantra">
-          <svg viewBox="0 0 80 80" xmlns="http://www.w3.org/2000/svg">
-            <circle cx="40" cy="40" r="36" fill="none" stroke="#c9a84c" stroke-width="1" opacity="0.5"/>
-            <circle cx="40" cy="40" r="28" fill="none" stroke="#c9a84c" stroke-width="0.5" opacity="0.35"/>
-            <polygon points="40,10 18,55 62,55" fill="none" stroke="#c9a84c" stroke-width="0.8" opacity="0.5"/>
-            <polygon points="40,70 18,25 62,25" fill="none" stroke="#c9a84c" stroke-width="0.8" opacity="0.5"/>
-            <circle cx="40" cy="40" r="8" fill="none" stroke="#c9a84c" stroke-width="0.8" opacity="0.4"/>
-            <circle cx="40" cy="40" r="2.5" fill="#c9a84c" opacity="0.4"/>
-          </svg>
-        </div>
-        <h2>EnterpriseClaw</h2>
-        <p>Deterministic Agentic Framework</p>
-        <p class="welcome-hint">Type a message to begin</p>
-      </div>
-
-      <div class="typing" id="typing">
-        <div class="typing-dots">
-          <span></span><span></span><span></span>
-        </div>
-      </div>
-    </div>
-
-    <!-- Floating Input -->
-    <div class="input-float">
-      <div class="input-glass">
-        <textarea class="input-field" id="input" placeholder="Message EnterpriseClaw..." rows="1"></textarea>
-        <button class="send-btn" id="sendBtn" onclick="sendMessage()">↑</button>
-      </div>
-    </div>
-  </main>
-</div>
+"""
 
-<script>
-  const THREAD_ID = 'web_' + Math.random().toString(36).slice(2, 10);
+CHAT_JS = r"""
+  let threadId = '';  // issued by the server in the socket's first frame
   let isWaiting = false;
 
-  // ═══ Auto-resize textarea ═══
+  // DOM refs, looked up once
   const input = document.getElementById('input');
+  const sendBtn = document.getElementById('sendBtn');
+  const messagesEl = document.getElementById('messages');
+  const typingEl = document.getElementById('typing');
+  let welcomeEl = document.getElementById('welcome');
+
+  // ═══ Auto-resize textarea ═══
+  // CSS sizes the box from a mirrored copy of the text; nothing is measured
+  const inputGrow = document.getElementById('inputGrow');
   input.addEventListener('input', () => {
-    input.style.height = 'auto';
-    input.style.height = Math.min(input.scrollHeight, 100) + 'px';
+    inputGrow.dataset.replicatedValue = input.value;
   });
 
   // ═══ Send message ═══
-  async function sendMessage() {
+  function sendMessage() {
     const text = input.value.trim();
     if (!text || isWaiting) return;
 
     // Hide welcome
-    const welcome = document.getElementById('welcome');
-    if (welcome) welcome.remove();
+    if (welcomeEl) {
+      welcomeEl.remove();
+      welcomeEl = null;
+    }
 
     // Add user message
     addMessage(text, 'user');
     input.value = '';
-    input.style.height = 'auto';
+    inputGrow.dataset.replicatedValue = '';
 
     // Show typing
     isWaiting = true;
-    document.getElementById('sendBtn').disabled = true;
+    sendBtn.disabled = true;
     showTyping(true);
 
-    try {
-      const resp = await fetch('/api/chat', {
-        method: 'POST',
-        headers: {'Content-Type': 'application/json'},
-        body: JSON.stringify({ message: text, thread_id: THREAD_ID })
-      });
-      const data = await resp.json();
+    // Queue the turn; the reply arrives over the socket
+    send({ type: 'message', user_input: text });
+  }
 
-      showTyping(false);
+  function endWaiting() {
+    isWaiting = false;
+    sendBtn.disabled = false;
+    input.focus();
+  }
 
-      if (data.approval_required) {
-        addHitlCard(data.action, data.details, data.tool_args);
-      } else if (data.response) {
-        addMessage(data.response, 'bot');
-      } else if (data.error) {
-        addMessage('❌ ' + data.error, 'bot');
+  // ═══ Server connection ═══
+  // One WebSocket carries turns and approvals up, and streamed tokens,
+  // replies, approval requests and turn ends down. The server drains
+  // everything queued since its last send into one frame, so each frame is
+  // an array of events.
+  let socket = null;
+  let reconnectDelay = 500;
+  const outbox = [];  // frames sent while (re)connecting
+
+  function connect() {
+    const proto = location.protocol === 'https:' ? 'wss' : 'ws';
+    socket = new WebSocket(`${proto}://${location.host}/ws/chat?thread_id=${encodeURIComponent(threadId)}`);
+    socket.onopen = () => {
+      reconnectDelay = 500;
+      while (outbox.length) socket.send(outbox.shift());
+    };
+    socket.onmessage = e => {
+      for (const event of JSON.parse(e.data)) handleEvent(event);
+    };
+    socket.onclose = () => {
+      // A turn in flight is lost with the socket; don't leave the page waiting
+      if (isWaiting) {
+        outbox.length = 0;
+        showTyping(false);
+        flushTokens();
+        streamBubble = null;
+        addMessage('❌ Connection lost. Please try again.', 'bot');
+        endWaiting();
+      }
+      setTimeout(connect, reconnectDelay);
+      reconnectDelay = Math.min(reconnectDelay * 2, 10000);
+    };
+  }
+
+  function send(payload) {
+    const frame = JSON.stringify(payload);
+    if (socket && socket.readyState === WebSocket.OPEN) socket.send(frame);
+    else outbox.push(frame);
+  }
+
+  connect();
+
+  let streamBubble = null;
+
+  function handleEvent(event) {
+    if (event.type === 'session') {
+      threadId = event.thread_id;
+    } else if (event.type === 'token') {
+      appendToken(event.token);
+    } else if (event.type === 'message') {
+      showTyping(false);
+      discardTokens();  // superseded by the final text
+      if (streamBubble) {
+        // Replace the raw streamed text with the rendered final reply
+        fillBotBubble(streamBubble, event.content);
+        streamBubble = null;
+        scrollToBottom();
+      } else {
+        addMessage(event.content, 'bot');
+      }
+      endWaiting();
+    } else if (event.type === 'approval') {
+      showTyping(false);
+      flushTokens();
+      streamBubble = null;
+      addHitlCard(event.action, null, event.tool_args);
+      endWaiting();
+    } else if (event.type === 'error') {
+      showTyping(false);
+      addMessage('❌ ' + event.error, 'bot');
+      endWaiting();
+    } else if (event.type === 'done') {
+      // Ends every turn. A stream still open here got no final `message`
+      // (the worker suppressed the reply), so its draft text is dropped.
+      showTyping(false);
+      discardTokens();
+      if (streamBubble) {
+        dropRow(streamBubble);
+        streamBubble = null;
       }
-    } catch (e) {
+      if (isWaiting) endWaiting();
+    }
+  }
+
+  // Tokens often arrive faster than the display refreshes; buffer them and
+  // touch the DOM (and scroll) once per animation frame
+  let tokenBuffer = '';
+  let tokenFrame = 0;
+
+  function appendToken(token) {
+    tokenBuffer += token;
+    if (!tokenFrame) tokenFrame = requestAnimationFrame(flushTokens);
+  }
+
+  function flushTokens() {
+    cancelAnimationFrame(tokenFrame);
+    tokenFrame = 0;
+    if (!tokenBuffer) return;
+    if (!streamBubble) {
       showTyping(false);
-      addMessage('❌ Connection error. Is the server running?', 'bot');
+      streamBubble = el('div', 'msg bot');
+      streamBubble.append(el('div', 'msg-name', 'EnterpriseClaw'), document.createTextNode(''));
+      appendRow(streamBubble);
     }
+    streamBubble.lastChild.appendData(tokenBuffer);
+    tokenBuffer = '';
+    flushRows();
+    messagesEl.scrollTop = messagesEl.scrollHeight;
+  }
 
-    isWaiting = false;
-    document.getElementById('sendBtn').disabled = false;
-    input.focus();
+  function discardTokens() {
+    cancelAnimationFrame(tokenFrame);
+    tokenFrame = 0;
+    tokenBuffer = '';
   }
 
   // ═══ Add message bubble ═══
   function addMessage(text, role) {
-    const container = document.getElementById('messages');
-    const typing = document.getElementById('typing');
     const div = document.createElement('div');
     div.className = `msg ${role}`;
 
     if (role === 'bot') {
-      div.innerHTML = `<div class="msg-name">EnterpriseClaw</div>${renderMarkdown(text)}`;
+      fillBotBubble(div, text);
     } else {
       div.textContent = text;
     }
 
-    container.insertBefore(div, typing);
+    appendRow(div);
     scrollToBottom();
   }
 
+  // The name is a text node; only the already-escaped markdown output goes
+  // through the HTML parser, via one reused <template>
+  const mdTemplate = document.createElement('template');
+
+  function fillBotBubble(div, text) {
+    mdTemplate.innerHTML = renderMarkdown(text);
+    div.replaceChildren(el('div', 'msg-name', 'EnterpriseClaw'), mdTemplate.content);
+  }
+
+  // ═══ Windowed transcript ═══
+  // Past VIRTUALIZE_AFTER rows only those near the viewport stay mounted.
+  // Detached rows keep their node (and any HITL button state); two spacers
+  // stand in for them, sized from the height each had when it was unmounted.
+  const VIRTUALIZE_AFTER = 100;
+  const OVERSCAN = 10;
+  const ROW_GAP = 16;        // .messages gap
+  const ROW_ESTIMATE = 80;   // rows that have never been laid out
+  const topSpacer = document.getElementById('topSpacer');
+  const bottomSpacer = document.getElementById('bottomSpacer');
+  const rows = [];
+  const heights = [];
+  let first = 0, last = -1;  // mounted range, inclusive
+  // Rows appended since the last frame, inserted with one DOM mutation
+  const pendingRows = document.createDocumentFragment();
+
+  function flushRows() {
+    if (pendingRows.firstChild) bottomSpacer.before(pendingRows);
+  }
+
+  function appendRow(node) {
+    // Promote to a layer for the fadeUp entrance only, then release it
+    node.style.willChange = 'transform, opacity';
+    node.addEventListener('animationend', () => node.style.willChange = 'auto', { once: true });
+    rows.push(node);
+    if (last === rows.length - 2) {
+      pendingRows.append(node);
+      last++;
+    }
+    scheduleWindow();
+  }
+
+  function dropRow(node) {
+    const i = rows.lastIndexOf(node);
+    if (i < 0) return;
+    rows.splice(i, 1);
+    heights.splice(i, 1);
+    if (i < first) first--;
+    if (i <= last) last--;
+    node.remove();
+    scheduleWindow();
+  }
+
+  let pendingWindow = false;
+  function scheduleWindow() {
+    if (pendingWindow) return;
+    pendingWindow = true;
+    requestAnimationFrame(() => {
+      pendingWindow = false;
+      updateWindow();
+    });
+  }
+  messagesEl.addEventListener('scroll', scheduleWindow, { passive: true });
+
+  function rowHeight(i) {
+    const h = i >= first && i <= last ? rows[i].offsetHeight : (heights[i] ?? ROW_ESTIMATE);
+    return h + ROW_GAP;
+  }
+
+  function spanHeight(from, to) {
+    let h = 0;
+    for (let i = from; i < to; i++) h += rowHeight(i);
+    return h;
+  }
+
+  function updateWindow() {
+    flushRows();
+
+    const n = rows.length;
+    let nf = 0, nl = n - 1;
+
+    if (n > VIRTUALIZE_AFTER) {
+      const top = messagesEl.scrollTop;
+      const bottom = top + messagesEl.clientHeight;
+      let y = topSpacer.getBoundingClientRect().top - messagesEl.getBoundingClientRect().top + top;
+      let i = 0, h = rowHeight(0);
+      while (i < n - 1 && y + h <= top) { y += h; h = rowHeight(++i); }
+      const firstVisible = i;
+      while (i < n - 1 && y < bottom) { y += h; h = rowHeight(++i); }
+      nf = Math.max(0, firstVisible - OVERSCAN);
+      nl = Math.min(n - 1, i + OVERSCAN);
+    }
+    if (nf === first && nl === last) return;
+
+    // Measure everything leaving the window before touching the DOM
+    const leaving = [];
+    for (let i = first; i <= last; i++) {
+      if (i < nf || i > nl) leaving.push(i);
+    }
+    for (const i of leaving) heights[i] = rows[i].offsetHeight;
+    for (const i of leaving) {
+      rows[i].style.animation = 'none';  // don't replay fadeUp on remount
+      rows[i].style.willChange = 'auto';
+      rows[i].remove();
+    }
+
+    const keepFrom = Math.max(first, nf), keepTo = Math.min(last, nl);
+    if (keepFrom > keepTo) {
+      bottomSpacer.before(...rows.slice(nf, nl + 1));
+    } else {
+      topSpacer.after(...rows.slice(nf, keepFrom));
+      bottomSpacer.before(...rows.slice(keepTo + 1, nl + 1));
+    }
+    first = nf;
+    last = nl;
+
+    topSpacer.style.height = spanHeight(0, first) + 'px';
+    bottomSpacer.style.height = spanHeight(last + 1, n) + 'px';
+  }
+
   // ═══ Basic Markdown renderer ═══
-  function renderMarkdown(text) {
-    text = text.replace(/```(\w*)\n?([\s\S]*?)```/g, '<pre><code>$2</code></pre>');
-    text = text.replace(/`([^`]+)`/g, '<code>$1</code>');
-    text = text.replace(/\*\*(.+?)\*\*/g, '<strong>$1</strong>');
-    text = text.replace(/\*(.+?)\*/g, '<strong>$1</strong>');
-    text = text.replace(/_(.+?)_/g, '<em>$1</em>');
-    text = text.replace(/^[-•] (.+)$/gm, '<li>$1</li>');
-    text = text.replace(/(<li>.*<\/li>\n?)+/g, '<ul>$&</ul>');
-    text = text.replace(/\n/g, '<br>');
-    return text;
+  // One left-to-right pass over the text: ``` fences, `code`, **bold**,
+  // *italic* / _italic_ and "- " / "• " list items. Everything else is escaped.
+  // Entities indexed by char code; '>' (62) is the highest escaped code
+  const ESC = [];
+  ESC[34] = '&quot;'; ESC[38] = '&amp;'; ESC[39] = '&#39;'; ESC[60] = '&lt;'; ESC[62] = '&gt;';
+
+  // Copies the runs between escapable characters with slice; text with
+  // nothing to escape is returned as is
+  function esc(s) {
+    s = String(s);
+    let out = '', run = 0;
+    for (let i = 0; i < s.length; i++) {
+      const c = s.charCodeAt(i);
+      if (c > 62 || ESC[c] === undefined) continue;
+      out += s.slice(run, i) + ESC[c];
+      run = i + 1;
+    }
+    return run === 0 ? s : out + s.slice(run);
   }
 
-  // ═══ HITL approval card ═══
-  function addHitlCard(action, details, toolArgs) {
-    const container = document.getElementById('messages');
-    const typing = document.getElementById('typing');
-
-    const argsHtml = Object.entries(toolArgs || {})
-      .map(([k, v]) => `  • <strong>${k}</strong>: ${v}`)
-      .join('\n');
-
-    const card = document.createElement('div');
-    card.className = 'hitl-card';
-    card.innerHTML = `
-      <div class="hitl-title">◈ Approval Required</div>
-      <div class="hitl-details">
-        <strong>Action:</strong> ${action}
-        ${argsHtml ? '\n' + argsHtml : ''}
-      </div>
-      <div class="hitl-buttons">
-        <button class="hitl-btn approve" onclick="handleApproval('approve', this)">Approve</button>
-        <button class="hitl-btn reject" onclick="handleApproval('reject', this)">Reject</button>
-      </div>
-    `;
-    container.insertBefore(card, typing);
-    scrollToBottom();
+  // The scanner dispatches on char codes rather than one-char strings or regexes
+  const C_NL = 10, C_SPACE = 32, C_STAR = 42, C_DASH = 45, C_UNDERSCORE = 95, C_BACKTICK = 96, C_BULLET = 0x2022;
+  const MD_TAGS = {'**': 'strong', '*': 'em', '_': 'em'};
+
+  function isWordCode(c) {
+    return (c >= 48 && c <= 57) || (c >= 65 && c <= 90) || (c >= 97 && c <= 122) || c === C_UNDERSCORE;
   }
 
-  // ═══ Handle approval ═══
-  async function handleApproval(decision, btn) {
-    const buttons = btn.parentElement.querySelectorAll('button');
-    buttons.forEach(b => b.disabled = true);
+  function isSpecialCode(c) {
+    return c === C_NL || c === C_STAR || c === C_UNDERSCORE || c === C_BACKTICK;
+  }
 
-    btn.textContent = decision === 'approve' ? 'Executing...' : 'Rejected';
+  function renderMarkdown(src) {
+    const out = [];
+    const open = [];          // emphasis markers currently open
+    const n = src.length;
+    let i = 0;
+    let inList = false, inItem = false;
 
-    showTyping(true);
+    // An emphasis marker only opens if it is closed later on the same line
+    const closes = (marker, from) => {
+      const end = src.indexOf(marker, from);
+      const eol = src.indexOf('\n', from);
+      return end > from && (eol === -1 || end < eol);
+    };
+    const closeEmphasis = () => {
+      while (open.length) out.push(`</${MD_TAGS[open.pop()]}>`);
+    };
 
-    try {
-      const resp = await fetch('/api/chat/approve', {
-        method: 'POST',
-        headers: {'Content-Type': 'application/json'},
-        body: JSON.stringify({ decision, thread_id: THREAD_ID })
-      });
-      const data = await resp.json();
+    while (i < n) {
+      const c = src.charCodeAt(i);
 
-      showTyping(false);
+      if (i === 0 || src.charCodeAt(i - 1) === C_NL) {
+        if ((c === C_DASH || c === C_BULLET) && src.charCodeAt(i + 1) === C_SPACE) {
+          out.push(inList ? '<li>' : '<ul><li>');
+          inList = inItem = true;
+          i += 2;
+          continue;
+        }
+        if (inList) { out.push('</ul>'); inList = false; }
+      }
 
-      if (data.response) {
-        addMessage(data.response, 'bot');
+      if (c === C_NL) {
+        closeEmphasis();
+        out.push(inItem ? '</li>' : '<br>');
+        inItem = false;
+        i++;
+        continue;
       }
 
-      btn.textContent = decision === 'approve' ? '✓ Approved' : '✗ Rejected';
-    } catch (e) {
-      showTyping(false);
-      addMessage('❌ Error processing approval.', 'bot');
+      if (c === C_BACKTICK) {
+        if (src.startsWith('```', i)) {
+          const close = src.indexOf('```', i + 3);
+          if (close !== -1) {
+            let start = i + 3;
+            while (start < close && isWordCode(src.charCodeAt(start))) start++;  // language tag
+            if (src.charCodeAt(start) === C_NL) start++;
+            out.push('<pre><code>', esc(src.slice(start, close)), '</code></pre>');
+            i = close + 3;
+            continue;
+          }
+        }
+        const close = src.indexOf('`', i + 1);
+        if (close > i + 1) {
+          out.push('<code>', esc(src.slice(i + 1, close)), '</code>');
+          i = close + 1;
+          continue;
+        }
+      } else if (c === C_STAR || c === C_UNDERSCORE) {
+        const marker = c === C_UNDERSCORE ? '_' : src.charCodeAt(i + 1) === C_STAR ? '**' : '*';
+        if (open[open.length - 1] === marker) {
+          out.push(`</${MD_TAGS[marker]}>`);
+          open.pop();
+          i += marker.length;
+          continue;
+        }
+        // Intraword underscores (snake_case) stay literal
+        const intraword = c === C_UNDERSCORE && i > 0 && isWordCode(src.charCodeAt(i - 1));
+        if (!intraword && !open.includes(marker) && closes(marker, i + marker.length)) {
+          out.push(`<${MD_TAGS[marker]}>`);
+          open.push(marker);
+        } else {
+          out.push(marker);
+        }
+        i += marker.length;
+        continue;
+      }
+
+      // Plain run up to the next special character
+      let j = i + 1;
+      while (j < n && !isSpecialCode(src.charCodeAt(j))) j++;
+      out.push(esc(src.slice(i, j)));
+      i = j;
     }
+
+    closeEmphasis();
+    if (inItem) out.push('</li>');
+    if (inList) out.push('</ul>');
+    return out.join('');
+  }
+
+  // ═══ HITL approval card ═══
+  // Each approval button -> both buttons of its card, so a decision can
+  // disable the pair without querying the DOM
+  const hitlPairs = new WeakMap();
+
+  function addHitlCard(action, details, toolArgs) {
+    // Built detached with text nodes only: one DOM insertion, no HTML parsing
+    const card = el('div', 'hitl-card');
+    const body = el('div', 'hitl-details');
+    body.append(el('strong', null, 'Action:'), ' ' + action);
+    for (const [k, v] of Object.entries(toolArgs || {})) {
+      body.append('\n  • ', el('strong', null, k), ': ' + (typeof v === 'string' ? v : JSON.stringify(v)));
+    }
+
+    const buttons = el('div', 'hitl-buttons');
+    const pair = [];
+    for (const [decision, label] of [['approve', 'Approve'], ['reject', 'Reject']]) {
+      const btn = el('button', `hitl-btn ${decision}`, label);
+      btn.dataset.action = decision;
+      hitlPairs.set(btn, pair);
+      pair.push(btn);
+    }
+    buttons.append(...pair);
+
+    card.append(el('div', 'hitl-title', '◈ Approval Required'), body, buttons);
+    appendRow(card);
+    scrollToBottom();
+  }
+
+  // ═══ Handle approval ═══
+  // One delegated listener serves every card, present and future
+  messagesEl.addEventListener('click', e => {
+    const btn = e.target.closest('.hitl-btn');
+    if (btn && !btn.disabled) handleApproval(btn.dataset.action, btn);
+  });
+
+  function handleApproval(decision, btn) {
+    for (const b of hitlPairs.get(btn)) b.disabled = true;
+
+    btn.textContent = decision === 'approve' ? '✓ Approved' : '✗ Rejected';
+    isWaiting = true;
+    sendBtn.disabled = true;
+    showTyping(true);
+
+    // The outcome arrives over the socket
+    send({ type: 'resume', action: decision });
   }
 
   // ═══ Helpers ═══
+  function el(tag, className, text) {
+    const node = document.createElement(tag);
+    if (className) node.className = className;
+    if (text != null) node.textContent = text;
+    return node;
+  }
+
   function showTyping(show) {
-    document.getElementById('typing').classList.toggle('show', show);
+    typingEl.classList.toggle('show', show);
     if (show) scrollToBottom();
   }
 
+  // Coalesce scroll requests (one per streamed token) into a single write per frame
+  let pendingScroll = false;
   function scrollToBottom() {
-    const container = document.getElementById('messages');
-    setTimeout(() => container.scrollTop = container.scrollHeight, 50);
+    if (pendingScroll) return;
+    pendingScroll = true;
+    requestAnimationFrame(() => {
+      pendingScroll = false;
+      flushRows();
+      messagesEl.scrollTop = messagesEl.scrollHeight;
+    });
   }
 
+  sendBtn.addEventListener('click', sendMessage);
+
   // Enter to send, Shift+Enter for newline
   input.addEventListener('keydown', e => {
     if (e.key === 'Enter' && !e.shiftKey) {
@@ -969,8 +1426,196 @@ CHAT_HTML = r"""
       sendMessage();
     }
   });
-</script>
+
+  // Stop the infinite pulses while the tab is in the background
+  document.addEventListener('visibilitychange', () => {
+    document.documentElement.classList.toggle('tab-hidden', document.hidden);
+  });
+"""
+
+# <!--fonts--> / <!--chat.css--> / <!--chat.js--> are replaced with asset tags below
+CHAT_HTML = r"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>EnterpriseClaw — Chat</title>
+<!--fonts-->
+<!--chat.css-->
+</head>
+<body>
+
+<!-- ═══ YANTRA SVG BACKGROUND ═══ -->
+<!--yantra.svg-->
+
+<div class="shell">
+  <!-- ═══ SIDEBAR ═══ -->
+  <aside class="sidebar">
+    <div class="sidebar-logo">
+      <div class="sidebar-logo-icon">⚡</div>
+      <div class="sidebar-logo-title" style="font-size: 16px;">EnterpriseClaw</div>
+      <div class="sidebar-logo-sub">Production Agent</div>
+    </div>
+
+    <div class="sidebar-divider"></div>
+
+    <nav class="sidebar-nav">
+      <div class="sidebar-nav-item active">
+        <span class="nav-icon">◈</span>
+        Chat
+      </div>
+      <div class="sidebar-nav-item">
+        <span class="nav-icon">◇</span>
+        Memory
+      </div>
+      <div class="sidebar-nav-item">
+        <span class="nav-icon">△</span>
+        Skills
+      </div>
+    </nav>
+
+    <div class="sidebar-footer">
+      <div class="sidebar-status">Online</div>
+      <div class="sidebar-footer-text">Powered by Gemini</div>
+    </div>
+  </aside>
+
+  <!-- ═══ MAIN PANEL ═══ -->
+  <main class="main-panel">
+    <!-- Panel Header -->
+    <div class="panel-header">
+      <span class="panel-header-title">Chat</span>
+      <span class="panel-header-line"></span>
+    </div>
+
+    <!-- Messages -->
+    <div class="messages" id="messages">
+      <div class="welcome" id="welcome">
+        <div class="welcome-yantra">
+          <!--yantra-small.svg-->
+        </div>
+        <h2>EnterpriseClaw</h2>
+        <p>Deterministic Agentic Framework</p>
+        <p class="welcome-hint">Type a message to begin</p>
+      </div>
+
+      <div class="spacer top" id="topSpacer"></div>
+      <div class="spacer bottom" id="bottomSpacer"></div>
+
+      <div class="typing" id="typing">
+        <div class="typing-dots">
+          <span></span><span></span><span></span>
+        </div>
+      </div>
+      <div class="scroll-anchor"></div>
+    </div>
+
+    <!-- Floating Input -->
+    <div class="input-float">
+      <div class="input-glass">
+        <div class="input-grow" id="inputGrow">
+          <textarea class="input-field" id="input" placeholder="Message EnterpriseClaw..." rows="1"></textarea>
+        </div>
+        <button class="send-btn" id="sendBtn">↑</button>
+      </div>
+    </div>
+  </main>
+</div>
+
+<!--chat.js-->
 
 </body>
 </html>
 """
+
+# ══ Build the static payloads once at import ══
+# Self-hosted font subsets built by scripts/build_fonts.py; without both
+# files the page falls back to Google Fonts.
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+FONTS_DIR = STATIC_DIR / "fonts"
+FONT_FACES = {"inter": ("Inter", "300 700"), "cinzel": ("Cinzel", "600 700")}
+GOOGLE_FONTS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">\n'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n'
+    '<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700'
+    '&family=Cinzel:wght@600;700&display=swap" rel="stylesheet">'
+)
+
+
+def _load_fonts() -> Dict[str, _StaticAsset]:
+    """Fingerprinted name -> asset for every font file, or {} if any is missing."""
+    fonts = {}
+    for stem in FONT_FACES:
+        path = FONTS_DIR / f"{stem}.woff2"
+        if not path.is_file():
+            return {}
+        asset = _StaticAsset(path.read_bytes(), "font/woff2", IMMUTABLE, compress=False)
+        fonts[f"{stem}.{asset.digest[:16]}.woff2"] = asset
+    return fonts
+
+
+CHAT_FONTS = _load_fonts()
+if CHAT_FONTS:
+    FONT_CSS = "".join(
+        f"@font-face {{ font-family: '{family}'; src: url('/chat/assets/{name}') format('woff2');"
+        f" font-weight: {weights}; font-display: swap; }}\n"
+        for name, (family, weights) in zip(CHAT_FONTS, FONT_FACES.values())
+    )
+    FONT_LINKS = "\n".join(
+        f'<link rel="preload" href="/chat/assets/{name}" as="font" type="font/woff2" crossorigin>'
+        for name in CHAT_FONTS
+    )
+    FONT_HINTS = ", ".join(
+        f'</chat/assets/{name}>; rel=preload; as=font; type="font/woff2"; crossorigin'
+        for name in CHAT_FONTS
+    )
+else:
+    FONT_CSS, FONT_LINKS = "", GOOGLE_FONTS
+    FONT_HINTS = "<https://fonts.googleapis.com>; rel=preconnect, <https://fonts.gstatic.com>; rel=preconnect; crossorigin"
+
+# Minified before hashing so fingerprints and SRI match the served bytes
+CHAT_CSS_ASSET = _StaticAsset(_minify(FONT_CSS + CHAT_CSS, "style"), "text/css; charset=utf-8", IMMUTABLE)
+CHAT_JS_ASSET = _StaticAsset(_minify(CHAT_JS, "script"), "text/javascript; charset=utf-8", IMMUTABLE)
+CHAT_CSS_NAME = f"chat.{CHAT_CSS_ASSET.digest[:16]}.css"
+CHAT_JS_NAME = f"chat.{CHAT_JS_ASSET.digest[:16]}.js"
+
+# Decorative yantras are identical on every load, so they are cached
+# separately from the page rather than inlined into it
+def _load_svg(stem: str) -> Tuple[str, _StaticAsset]:
+    """Fingerprinted name and asset for static/<stem>.svg."""
+    asset = _StaticAsset((STATIC_DIR / f"{stem}.svg").read_bytes(), "image/svg+xml", IMMUTABLE)
+    return f"{stem}.{asset.digest[:16]}.svg", asset
+
+
+YANTRA_IMAGES = dict(_load_svg(stem) for stem in ("yantra", "yantra-small"))
+YANTRA_SRC, YANTRA_SMALL_SRC = (f"/chat/assets/{name}" for name in YANTRA_IMAGES)
+
+CHAT_ASSETS = {
+    CHAT_CSS_NAME: CHAT_CSS_ASSET,
+    CHAT_JS_NAME: CHAT_JS_ASSET,
+    **CHAT_FONTS,
+    **YANTRA_IMAGES,
+}
+
+# /chat is not a fingerprinted URL, so it is cacheable but not `immutable`
+# Placeholders are substituted before minifying, which strips comments
+CHAT_PAGE = _StaticAsset(
+    _minify(
+        CHAT_HTML
+        .replace("<!--fonts-->", FONT_LINKS)
+        .replace("<!--yantra.svg-->", f'<img class="yantra-bg" src="{YANTRA_SRC}" alt="" decoding="async">')
+        .replace("<!--yantra-small.svg-->", f'<img src="{YANTRA_SMALL_SRC}" alt="" width="80" height="80">')
+        .replace(
+            "<!--chat.css-->",
+            f'<link rel="stylesheet" href="/chat/assets/{CHAT_CSS_NAME}" integrity="{CHAT_CSS_ASSET.integrity}">',
+        )
+        .replace(
+            "<!--chat.js-->",
+            f'<script src="/chat/assets/{CHAT_JS_NAME}" integrity="{CHAT_JS_ASSET.integrity}" defer></script>',
+        )
+    ),
+    "text/html; charset=utf-8",
+    "public, max-age=3600",
+    link=FONT_HINTS,
+)
@@ -299,8 +299,10 @@ HEALTH_ID = "__health_check__"
 class ZvecMemoryStore:
     """In-process Semantic Memory DB backed by Zvec + SQLite doc store."""
 
-    def __init__(self, db_client: DatabaseClient):
+    def __init__(self, db_client: DatabaseClient, path: str = ZVEC_PATH, skills_path: str = ZVEC_SKILLS_PATH):
         self.db = db_client
+        self.path = path
+        self.skills_path = skills_path
         self.collection = None
         self._needs_rebuild = False  # set True when corruption forces a fresh index
         self._zvec_write_lock = asyncio.Lock()
@@ -346,13 +348,13 @@ class ZvecMemoryStore:
 
         # --- Memory index ---
         try:
-            self.collection = zvec.open(path=ZVEC_PATH)
+            self.collection = zvec.open(path=self.path)
             self._ensure_health_doc(self.collection)
             if not self._probe_integrity(self.collection):
                 raise RuntimeError("Memory Zvec integrity probe failed")
         except Exception as e:
             logger.warning(f"⚠️  zvec_index open/probe failed ({e}), rebuilding from SQLite...")
-            self.collection = self._wipe_and_recreate(ZVEC_PATH, mem_schema)
+            self.collection = self._wipe_and_recreate(self.path, mem_schema)
             self._ensure_health_doc(self.collection)
             self._needs_rebuild = True  # will re-embed from SQLite after init
 
@@ -362,13 +364,13 @@ class ZvecMemoryStore:
             vectors=zvec.VectorSchema("embedding", zvec.DataType.VECTOR_FP32, self.dim),
         )
         try:
-            self.skill_collection = zvec.open(path=ZVEC_SKILLS_PATH)
+            self.skill_collection = zvec.open(path=self.skills_path)
             self._ensure_health_doc(self.skill_collection)
             if not self._probe_integrity(self.skill_collection):
                 raise RuntimeError("Skill Zvec integrity probe failed")
         except Exception as e:
             logger.warning(f"⚠️  zvec_skills open failed ({e}), recreating...")
-            self.skill_collection = self._wipe_and_recreate(ZVEC_SKILLS_PATH, skill_schema)
+            self.skill_collection = self._wipe_and_recreate(self.skills_path, skill_schema)
             self._ensure_health_doc(self.skill_collection)
 
     async def _embed(self, texts: List[str]) -> List[List[float]]:
@@ -393,7 +395,22 @@ class ZvecMemoryStore:
             return ""
             
         vector = (await self._embed([query]))[0]
-        
+        return await self._hybrid_search(query, vector, top_k)
+
+    async def get_relevant_context_batch(self, queries: List[str], top_k: int = 5) -> List[str]:
+        """Batched get_relevant_context: one embedding pass for all queries."""
+        if not self.collection or not queries:
+            return [""] * len(queries)
+
+        vectors = await self._embed(queries)
+        if len(vectors) != len(queries):  # embedding failed
+            return [""] * len(queries)
+        return list(await asyncio.gather(
+            *(self._hybrid_search(q, v, top_k) for q, v in zip(queries, vectors))
+        ))
+
+    async def _hybrid_search(self, query: str, vector: List[float], top_k: int) -> str:
+        """Run Zvec + FTS5 for one pre-embedded query and fuse the rankings."""
         # 1. Vector search (Zvec)
         zvec_ranked = []
         try:
@@ -685,9 +702,14 @@ class ZvecMemoryStore:
 class MemoryGate:
     """Background semantic extraction and retrieval."""
 
-    def __init__(self):
-        self.db = DatabaseClient()
-        self.store = ZvecMemoryStore(db_client=self.db)
+    def __init__(
+        self,
+        db_path: str = SQLITE_PATH,
+        zvec_path: str = ZVEC_PATH,
+        zvec_skills_path: str = ZVEC_SKILLS_PATH,
+    ):
+        self.db = DatabaseClient(db_path)
+        self.store = ZvecMemoryStore(db_client=self.db, path=zvec_path, skills_path=zvec_skills_path)
 
     async def initialize(self):
         """Must be called at application startup."""
@@ -0,0 +1,127 @@
+"""
+build_fonts.py — Builds the self-hosted web chat fonts.
+
+Downloads the Inter and Cinzel variable fonts and their OFL licences from
+the Google Fonts repository at the commit pinned in fonts.lock.json,
+checks each file against its pinned sha256, narrows the fonts' axes to
+the weights the chat stylesheet uses, subsets them to the Latin glyphs
+the chat UI renders and writes WOFF2 files (plus the licences) to
+static/fonts/. interfaces/web_chat.py serves them from /chat/assets/ when
+both font files exist and falls back to Google Fonts otherwise.
+
+The Docker image runs this in its `fonts` build stage. For a local
+checkout, run it once:
+  pip install fonttools==4.55.3 brotli==1.2.0 httpx==0.28.1
+  python scripts/build_fonts.py
+
+To move the pin to the current google/fonts main (needs network access;
+review and commit the rewritten lock file):
+  python scripts/build_fonts.py --update-lock
+"""
+
+import hashlib
+import io
+import json
+import sys
+from pathlib import Path
+from urllib.parse import quote
+
+import httpx
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+except ImportError:
+    sys.exit("❌ fontTools is required: pip install fonttools==4.55.3 brotli==1.2.0")
+
+FONTS_DIR = Path(__file__).resolve().parent.parent / "static" / "fonts"
+LOCK_PATH = Path(__file__).resolve().parent / "fonts.lock.json"
+
+REPO = "google/fonts"
+RAW_URL = "https://raw.githubusercontent.com/{repo}/{commit}/{path}"
+
+# Repository paths per font: the variable TTF and its licence
+SOURCES = {
+    "inter": ("ofl/inter/Inter[opsz,wght].ttf", "ofl/inter/OFL.txt"),
+    "cinzel": ("ofl/cinzel/Cinzel[wght].ttf", "ofl/cinzel/OFL.txt"),
+}
+
+# Axis limits per font: wght narrowed to the weights the chat CSS uses
+# (keep in sync with FONT_FACES in interfaces/web_chat.py), other axes
+# pinned to their default so their variation data is dropped
+AXES = {
+    "inter": {"wght": (300, 700), "opsz": None},
+    "cinzel": {"wght": (600, 700)},
+}
+
+# Basic Latin plus the typographic punctuation model replies commonly use
+UNICODES = [*range(0x20, 0x7F), 0xA0, 0x2013, 0x2014, 0x2018, 0x2019, 0x201C, 0x201D, 0x2022, 0x2026]
+
+
+def fetch(client: httpx.Client, commit: str, path: str) -> bytes:
+    """Download one repository file at `commit`."""
+    response = client.get(RAW_URL.format(repo=REPO, commit=commit, path=quote(path)))
+    response.raise_for_status()
+    return response.content
+
+
+def fetch_pinned(client: httpx.Client, lock: dict, path: str) -> bytes:
+    """Download one file at the locked commit and check its sha256."""
+    data = fetch(client, lock["commit"], path)
+    digest = hashlib.sha256(data).hexdigest()
+    if digest != lock["sha256"].get(path):
+        sys.exit(f"❌ sha256 mismatch for {path} at {lock['commit']}: got {digest}")
+    return data
+
+
+def build_font(name: str, source: bytes) -> Path:
+    """Write the WOFF2 subset of one variable TTF."""
+    font = TTFont(io.BytesIO(source))
+    font = instancer.instantiateVariableFont(font, AXES[name])
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=UNICODES)
+    subsetter.subset(font)
+
+    path = FONTS_DIR / f"{name}.woff2"
+    font.flavor = "woff2"
+    font.save(path)
+    return path
+
+
+def update_lock(client: httpx.Client) -> None:
+    """Pin the current main commit and record the sha256 of every source file."""
+    response = client.get(f"https://api.github.com/repos/{REPO}/commits/main")
+    response.raise_for_status()
+    commit = response.json()["sha"]
+    hashes = {
+        path: hashlib.sha256(fetch(client, commit, path)).hexdigest()
+        for paths in SOURCES.values()
+        for path in paths
+    }
+    LOCK_PATH.write_text(json.dumps({"commit": commit, "sha256": hashes}, indent=2) + "\n")
+    print(f"🔒 {LOCK_PATH.name} pinned to {REPO}@{commit[:12]}")
+
+
+def main():
+    FONTS_DIR.mkdir(parents=True, exist_ok=True)
+    with httpx.Client(follow_redirects=True, timeout=60.0) as client:
+        if "--update-lock" in sys.argv[1:]:
+            update_lock(client)
+        if not LOCK_PATH.is_file():
+            # Nothing unpinned is ever downloaded; the chat keeps using Google Fonts
+            print(f"⚠️ {LOCK_PATH.name} not found; run with --update-lock to pin the font sources")
+            return
+        lock = json.loads(LOCK_PATH.read_text())
+
+        for name, (font_path, licence_path) in SOURCES.items():
+            path = build_font(name, fetch_pinned(client, lock, font_path))
+            (FONTS_DIR / f"{name}-OFL.txt").write_bytes(fetch_pinned(client, lock, licence_path))
+            print(f"✅ {path.relative_to(FONTS_DIR.parent.parent)} ({path.stat().st_size // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,16 +11,27 @@ Usage:
 """
 
 import sys
+import gzip
+import time
 import asyncio
+import hashlib
+import functools
 import webbrowser
 import logging
 from pathlib import Path
 
 import httpx
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from pydantic import BaseModel
 
+# Serialize API responses with orjson when it is installed
+try:
+    import orjson  # noqa: F401 — required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as APIResponse
+except ImportError:
+    APIResponse = JSONResponse
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -32,6 +43,33 @@ ENV_EXAMPLE_PATH = PROJECT_ROOT / ".env.example"
 # 1. Validation helpers
 # ══════════════════════════════════════════════════════════════
 
+# Successful validations are remembered so repeat clicks and CLI retries
+# skip the HTTPS round-trip. Failures are never cached — the user may fix the key.
+VALID_CACHE_MAX = 128
+VALID_CACHE_TTL = 300  # seconds
+_valid_cache: dict[str, tuple[float, dict]] = {}
+
+
+def _cache_successes(func):
+    """Cache `valid=True` results of an async validator, keyed by a hash of the secret."""
+    @functools.wraps(func)
+    async def wrapper(secret: str) -> dict:
+        key = f"{func.__name__}:{hashlib.sha256(secret.encode()).hexdigest()}"
+        entry = _valid_cache.pop(key, None)
+        if entry and time.monotonic() - entry[0] < VALID_CACHE_TTL:
+            _valid_cache[key] = entry  # re-insert as most recently used
+            return entry[1]
+
+        result = await func(secret)
+        if result["valid"]:
+            if len(_valid_cache) >= VALID_CACHE_MAX:
+                _valid_cache.pop(next(iter(_valid_cache)))  # evict least recently used
+            _valid_cache[key] = (time.monotonic(), result)
+        return result
+    return wrapper
+
+
+@_cache_successes
 async def validate_gemini_key(api_key: str) -> dict:
     """Test a Gemini API key with a real lightweight call."""
     url = f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}"
@@ -50,6 +88,7 @@ async def validate_gemini_key(api_key: str) -> dict:
         return {"valid": False, "message": f"Connection error: {str(e)}"}
 
 
+@_cache_successes
 async def validate_telegram_token(token: str) -> dict:
     """Test a Telegram bot token via getMe."""
     url = f"https://api.telegram.org/bot{token}/getMe"
@@ -72,6 +111,7 @@ async def validate_telegram_token(token: str) -> dict:
         return {"valid": False, "message": f"Connection error: {str(e)}"}
 
 
+@functools.lru_cache(maxsize=256)
 def validate_chat_ids(chat_ids: str) -> dict:
     """Validate comma-separated chat IDs."""
     if not chat_ids.strip():
@@ -85,6 +125,15 @@ def validate_chat_ids(chat_ids: str) -> dict:
         return {"valid": False, "message": "Chat IDs must be numbers, separated by commas."}
 
 
+async def validate_all(gemini_key: str, telegram_token: str, chat_ids: str) -> dict:
+    """Validate all three credentials at once, firing the network checks concurrently."""
+    gemini, telegram = await asyncio.gather(
+        validate_gemini_key(gemini_key),
+        validate_telegram_token(telegram_token),
+    )
+    return {"gemini": gemini, "telegram": telegram, "chat_id": validate_chat_ids(chat_ids)}
+
+
 def write_env_file(config: dict) -> str:
     """Write the .env file from the collected configuration."""
     lines = [
@@ -113,12 +162,17 @@ def write_env_file(config: dict) -> str:
 # 2. FastAPI mini-app
 # ══════════════════════════════════════════════════════════════
 
-app = FastAPI(title="EnterpriseClaw Setup Wizard")
+app = FastAPI(title="EnterpriseClaw Setup Wizard", default_response_class=APIResponse)
 
 
 class ValidateRequest(BaseModel):
     key: str
 
+class ValidateAllRequest(BaseModel):
+    google_api_key: str
+    telegram_bot_token: str
+    allowed_chat_ids: str
+
 class CompleteRequest(BaseModel):
     google_api_key: str
     telegram_bot_token: str
@@ -127,28 +181,55 @@ class CompleteRequest(BaseModel):
     google_token_json: str = ""
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match per RFC 9110: "*" or any listed tag, compared weakly."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @app.get("/", response_class=HTMLResponse)
-async def serve_wizard():
-    """Serve the single-page onboarding wizard."""
-    return HTMLResponse(content=WIZARD_HTML, status_code=200)
+async def serve_wizard(request: Request):
+    """Serve the single-page onboarding wizard from the pre-encoded buffers."""
+    encoding = "gzip" if "gzip" in request.headers.get("accept-encoding", "") else None
+    etag, body = WIZARD_VARIANTS[encoding]
+    headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": WIZARD_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="text/html; charset=utf-8", headers=headers)
 
 
 @app.post("/api/validate/gemini")
 async def api_validate_gemini(req: ValidateRequest):
     result = await validate_gemini_key(req.key.strip())
-    return JSONResponse(content=result)
+    return APIResponse(content=result)
 
 
 @app.post("/api/validate/telegram")
 async def api_validate_telegram(req: ValidateRequest):
     result = await validate_telegram_token(req.key.strip())
-    return JSONResponse(content=result)
+    return APIResponse(content=result)
 
 
 @app.post("/api/validate/chat-id")
 async def api_validate_chat_id(req: ValidateRequest):
     result = validate_chat_ids(req.key.strip())
-    return JSONResponse(content=result)
+    return APIResponse(content=result)
+
+
+@app.post("/api/validate/all")
+async def api_validate_all(req: ValidateAllRequest):
+    result = await validate_all(
+        req.google_api_key.strip(),
+        req.telegram_bot_token.strip(),
+        req.allowed_chat_ids.strip(),
+    )
+    return APIResponse(content=result)
 
 
 @app.post("/api/complete")
@@ -156,7 +237,7 @@ async def api_complete(req: CompleteRequest):
     """Write .env and return success."""
     config = req.model_dump()
     env_path = write_env_file(config)
-    return JSONResponse(content={
+    return APIResponse(content={
         "success": True,
         "env_path": env_path,
         "message": "Configuration saved! You can now start EnterpriseClaw.",
@@ -206,25 +287,19 @@ WIZARD_HTML = r"""
     --glass-shadow:   0 8px 32px rgba(180, 140, 20, 0.08);
   }
 
+  /* Glow gradients live in body's own background (fixed, so they stay put
+     as before) instead of a full-viewport ::before overlay layer */
   body {
     font-family: var(--font-body);
-    background: linear-gradient(145deg, #faf7f0 0%, #f0e8d8 40%, #ede4d0 100%);
-    color: var(--text-primary);
-    min-height: 100vh;
-    overflow-x: hidden;
-  }
-
-  /* ─── Animated Background ──────────────────────────────── */
-  body::before {
-    content: '';
-    position: fixed;
-    inset: 0;
     background:
       radial-gradient(ellipse 900px 700px at 15% 20%, rgba(212, 175, 55, 0.10) 0%, transparent 70%),
       radial-gradient(ellipse 600px 500px at 85% 75%, rgba(212, 160, 23, 0.07) 0%, transparent 70%),
-      radial-gradient(ellipse 500px 500px at 50% 50%, rgba(255, 255, 255, 0.40) 0%, transparent 70%);
-    pointer-events: none;
-    z-index: 0;
+      radial-gradient(ellipse 500px 500px at 50% 50%, rgba(255, 255, 255, 0.40) 0%, transparent 70%),
+      linear-gradient(145deg, #faf7f0 0%, #f0e8d8 40%, #ede4d0 100%);
+    background-attachment: fixed;
+    color: var(--text-primary);
+    min-height: 100vh;
+    overflow-x: hidden;
   }
 
   /* ─── Shell ────────────────────────────────────────────── */
@@ -713,6 +788,34 @@ WIZARD_HTML = r"""
       <div class="btn-row" style="justify-content:center;">
         <button class="btn btn-next" onclick="goToStep(1)">Begin Setup →</button>
       </div>
+      <p class="card-desc" style="text-align:center; margin:16px 0 0;">
+        <span class="skip-link" onclick="openQuickSetup()">Re-running setup? Validate all keys at once</span>
+      </p>
+    </div>
+
+    <!-- ── Quick Setup: returning users paste every key together ── -->
+    <div class="card page" id="page-quick">
+      <h2 class="card-title">Quick Setup</h2>
+      <p class="card-desc">
+        Already have your keys? Paste them all and EnterpriseClaw will check them together.
+      </p>
+      <div class="input-group">
+        <label class="input-label">Google API Key</label>
+        <input class="input-field" id="quickGemini" type="password" placeholder="AIzaSy...">
+      </div>
+      <div class="input-group">
+        <label class="input-label">Bot Token</label>
+        <input class="input-field" id="quickTelegram" type="password" placeholder="123456789:AABBCCDD...">
+      </div>
+      <div class="input-group">
+        <label class="input-label">Allowed Chat IDs</label>
+        <input class="input-field" id="quickChatIds" type="text" placeholder="1234567890">
+        <div class="feedback" id="quickResult"></div>
+      </div>
+      <div class="btn-row">
+        <button class="btn btn-back" onclick="goToStep(0)">← Back</button>
+        <button class="btn btn-validate" id="btnValidateAll" onclick="validateAll()">Validate All</button>
+      </div>
     </div>
 
     <!-- ── Step 1: Google API Key ── -->
@@ -996,6 +1099,28 @@ WIZARD_HTML = r"""
     }
   }
 
+  // ═══ Request coalescing ═══
+  // Rapid clicks / Enter presses collapse into one trailing call, and a
+  // validator never has two requests in flight at once.
+  const debounce = (fn, ms) => {
+    let t, settle;
+    return (...a) => new Promise(resolve => {
+      clearTimeout(t);
+      if (settle) settle();  // superseded call resolves with nothing
+      settle = resolve;
+      t = setTimeout(async () => { settle = null; resolve(await fn(...a)); }, ms);
+    });
+  };
+
+  const singleFlight = fn => {
+    let inFlight = false;
+    return async (...a) => {
+      if (inFlight) return;
+      inFlight = true;
+      try { return await fn(...a); } finally { inFlight = false; }
+    };
+  };
+
   // ═══ Validation ═══
   async function validateGemini() {
     const key = document.getElementById('geminiKey').value.trim();
@@ -1093,6 +1218,69 @@ WIZARD_HTML = r"""
     btn.textContent = 'Validate';
   }
 
+  validateGemini   = debounce(singleFlight(validateGemini), 400);
+  validateTelegram = debounce(singleFlight(validateTelegram), 400);
+  validateChatId   = debounce(singleFlight(validateChatId), 400);
+
+  // ═══ Quick Setup (validate everything in one request) ═══
+  function openQuickSetup() {
+    document.querySelectorAll('.page').forEach(p => p.classList.remove('active'));
+    document.getElementById('page-quick').classList.add('active');
+  }
+
+  async function validateAll() {
+    const gemini = document.getElementById('quickGemini').value.trim();
+    const telegram = document.getElementById('quickTelegram').value.trim();
+    const chatId = document.getElementById('quickChatIds').value.trim();
+    if (!gemini || !telegram || !chatId) return;
+    const btn = document.getElementById('btnValidateAll');
+    const fb = document.getElementById('quickResult');
+
+    btn.disabled = true;
+    btn.innerHTML = '<span class="spinner"></span>Checking...';
+
+    try {
+      const resp = await fetch('/api/validate/all', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({
+          google_api_key: gemini,
+          telegram_bot_token: telegram,
+          allowed_chat_ids: chatId,
+        })
+      });
+      const data = await resp.json();
+      const results = [
+        ['quickGemini', data.gemini],
+        ['quickTelegram', data.telegram],
+        ['quickChatIds', data.chat_id],
+      ];
+      results.forEach(([id, r]) => {
+        document.getElementById(id).className = 'input-field ' + (r.valid ? 'valid' : 'invalid');
+      });
+      const allValid = results.every(([, r]) => r.valid);
+      fb.className = 'feedback ' + (allValid ? 'success' : 'error');
+      fb.textContent = results.map(([, r]) => r.message).join('  ·  ');
+
+      if (allValid) {
+        // Mirror the values into the regular steps so Back/summary stay consistent
+        document.getElementById('geminiKey').value = gemini;
+        document.getElementById('telegramToken').value = telegram;
+        document.getElementById('chatIds').value = chatId;
+        state.validated = { gemini: true, telegram: true, chatId: true };
+        state.values = { gemini, telegram, chatId, botName: data.telegram.bot_name || '' };
+        state.highestStep = 4;
+        goToStep(4);
+      }
+    } catch (e) {
+      fb.className = 'feedback error';
+      fb.textContent = 'Network error — check your connection.';
+    }
+    btn.disabled = false;
+    btn.textContent = 'Validate All';
+  }
+  validateAll = debounce(singleFlight(validateAll), 400);
+
   // ═══ Save Config ═══
   async function saveConfig() {
     // Update completion summary
@@ -1127,7 +1315,7 @@ WIZARD_HTML = r"""
 
   // ═══ Enter key support ═══
   document.addEventListener('keydown', e => {
-    if (e.key !== 'Enter') return;
+    if (e.key !== 'Enter' || e.repeat) return;
     const step = state.currentStep;
     if (step === 1) validateGemini();
     else if (step === 2) validateTelegram();
@@ -1139,11 +1327,32 @@ WIZARD_HTML = r"""
 </html>
 """
 
+# The page is static, so encode, compress and fingerprint it once at import.
+WIZARD_HTML_BYTES = WIZARD_HTML.encode("utf-8")
+WIZARD_HTML_GZIP = gzip.compress(WIZARD_HTML_BYTES, 6)
+_WIZARD_DIGEST = hashlib.blake2b(WIZARD_HTML_BYTES, digest_size=8).hexdigest()
+# Each content-coding is a different representation, so it gets its own strong ETag
+WIZARD_VARIANTS = {
+    "gzip": (f'"{_WIZARD_DIGEST}-gzip"', WIZARD_HTML_GZIP),
+    None: (f'"{_WIZARD_DIGEST}"', WIZARD_HTML_BYTES),
+}
+# Not fingerprinted, so the browser may keep it but must revalidate each load
+WIZARD_CACHE_CONTROL = "no-cache"
+
 
 # ══════════════════════════════════════════════════════════════
 # 4. CLI fallback
 # ══════════════════════════════════════════════════════════════
 
+def _prompt_non_empty(prompt: str, label: str) -> str:
+    """Keep asking until the user enters something."""
+    while True:
+        value = input(prompt).strip()
+        if value:
+            return value
+        print(f"  ⚠️  {label} cannot be empty.\n")
+
+
 async def run_cli():
     """Interactive CLI-only onboarding for headless environments."""
     print("\n" + "═" * 56)
@@ -1153,50 +1362,43 @@ async def run_cli():
 
     config = {}
 
-    # Step 1: Gemini API Key
+    # Steps 1–3: collect all values first so the network checks run concurrently
     print("── Step 1/4: Google API Key ──────────────────────────")
     print("  Get one at: https://aistudio.google.com/apikey\n")
-    while True:
-        key = input("  Paste your Google API Key: ").strip()
-        if not key:
-            print("  ⚠️  Key cannot be empty.\n")
-            continue
-        result = await validate_gemini_key(key)
-        if result["valid"]:
-            print(f"  {result['message']}\n")
-            config["google_api_key"] = key
-            break
-        else:
-            print(f"  ❌ {result['message']} Try again.\n")
+    key = _prompt_non_empty("  Paste your Google API Key: ", "Key")
 
-    # Step 2: Telegram Bot Token
     print("── Step 2/4: Telegram Bot Token ─────────────────────")
     print("  Create a bot: https://t.me/BotFather → /newbot\n")
-    while True:
-        token = input("  Paste your Bot Token: ").strip()
-        if not token:
-            print("  ⚠️  Token cannot be empty.\n")
-            continue
-        result = await validate_telegram_token(token)
-        if result["valid"]:
-            print(f"  {result['message']}\n")
-            config["telegram_bot_token"] = token
-            break
-        else:
-            print(f"  ❌ {result['message']} Try again.\n")
+    token = _prompt_non_empty("  Paste your Bot Token: ", "Token")
 
-    # Step 3: Chat IDs
     print("── Step 3/4: Telegram Chat ID ───────────────────────")
     print("  Find yours: message @userinfobot on Telegram\n")
-    while True:
+    ids = input("  Enter your Chat ID(s): ").strip()
+
+    print("\n  Validating...\n")
+    results = await validate_all(key, token, ids)
+
+    # Re-prompt only for the values that failed
+    while not results["gemini"]["valid"]:
+        print(f"  ❌ {results['gemini']['message']} Try again.\n")
+        key = _prompt_non_empty("  Paste your Google API Key: ", "Key")
+        results["gemini"] = await validate_gemini_key(key)
+    print(f"  {results['gemini']['message']}")
+    config["google_api_key"] = key
+
+    while not results["telegram"]["valid"]:
+        print(f"  ❌ {results['telegram']['message']} Try again.\n")
+        token = _prompt_non_empty("  Paste your Bot Token: ", "Token")
+        results["telegram"] = await validate_telegram_token(token)
+    print(f"  {results['telegram']['message']}")
+    config["telegram_bot_token"] = token
+
+    while not results["chat_id"]["valid"]:
+        print(f"  ❌ {results['chat_id']['message']} Try again.\n")
         ids = input("  Enter your Chat ID(s): ").strip()
-        result = validate_chat_ids(ids)
-        if result["valid"]:
-            print(f"  {result['message']}\n")
-            config["allowed_chat_ids"] = ids
-            break
-        else:
-            print(f"  ❌ {result['message']} Try again.\n")
+        results["chat_id"] = validate_chat_ids(ids)
+    print(f"  {results['chat_id']['message']}\n")
+    config["allowed_chat_ids"] = ids
 
     # Step 4: Google Workspace
     print("── Step 4/4: Google Workspace (Optional) ────────────")
@@ -1221,7 +1423,12 @@ async def run_cli():
 
 if __name__ == "__main__":
     if "--cli" in sys.argv:
-        asyncio.run(run_cli())
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:  # uvloop is not available on Windows
+            loop_factory = None
+        asyncio.run(run_cli(), loop_factory=loop_factory)
     else:
         import uvicorn
 
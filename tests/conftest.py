@@ -0,0 +1,53 @@
+"""
+Shared pytest fixtures.
+
+The whole session runs on one event loop, and MemoryGate (SQLite, Zvec
+indexes, FastEmbed model) is initialized once in a temporary directory and
+reused by every test; the real store under data/ is never written.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+import pytest_asyncio
+from dotenv import load_dotenv
+
+# Ensure the root directory is in sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Parse .env once for the whole session
+load_dotenv()
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the session on uvloop when it is installed."""
+    try:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mg(tmp_path_factory):
+    """
+    A MemoryGate on throwaway SQLite/Zvec paths, initialized once per session.
+    It also replaces the `memory.memorygate` singleton for the session, so
+    graph nodes read from it instead of the real memory store.
+    """
+    import memory
+
+    data_dir = tmp_path_factory.mktemp("memory")
+    gate = memory.MemoryGate(
+        db_path=str(data_dir / "agent_session.db"),
+        zvec_path=str(data_dir / "zvec_index"),
+        zvec_skills_path=str(data_dir / "zvec_skills"),
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(memory, "memorygate", gate)
+        await gate.initialize()
+        yield gate
+        await gate.store.close()
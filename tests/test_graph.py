@@ -1,49 +1,54 @@
-import asyncio
-import logging
-from dotenv import load_dotenv
-load_dotenv()
-from langgraph.checkpoint.memory import MemorySaver
-
-import sys
 import os
+import logging
 
-# Ensure the root directory is in sys.path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import MemorySaver
 
 from nodes.graph import build_graph
 
 logging.basicConfig(level=logging.INFO)
 
-async def run_test():
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not os.environ.get("GOOGLE_API_KEY"), reason="GOOGLE_API_KEY not set"),
+]
+
+
+async def test_graph_run(mg):
     checkpointer = MemorySaver()
     graph = build_graph(checkpointer=checkpointer)
-    
-    from memory import memorygate
-    await memorygate.initialize()
-    
+
     config = {"configurable": {"thread_id": "test_123"}}
-    
-    print("\n--- Test 1: Simple Message ---")
+
+    # Test 1: a simple message ends in a text reply
     async for event in graph.astream(
         {"chat_id": "test_123", "user_input": "Hi!"},
         config=config,
         stream_mode="updates"
     ):
-        print("Event:", event)
-        
+        assert isinstance(event, dict)
+
     state = await graph.aget_state(config)
-    print("\nFinal State Values:", state.values.get("messages"))
+    first_turn = state.values.get("messages", [])
+    assert not state.next
+    assert isinstance(first_turn[-1], AIMessage) and first_turn[-1].content
 
-    print("\n--- Test 2: Write Action ---")
+    # Test 2: a write action either pauses for approval or ends in a reply
     async for event in graph.astream(
         {"chat_id": "test_123", "user_input": "Schedule a meeting with john for tomorrow at 2pm about project alpha"},
         config=config,
         stream_mode="updates"
     ):
-        print("Event:", event)
+        assert isinstance(event, dict)
 
     state = await graph.aget_state(config)
-    print("\nFinal State Values:", state.values.get("messages"))
+    messages = state.values.get("messages", [])
+    assert len(messages) > len(first_turn)
+    if state.next:
+        assert state.next == ("human_approval",)
+    else:
+        assert isinstance(messages[-1], AIMessage)
 
 if __name__ == "__main__":
-    asyncio.run(run_test())
+    pytest.main([__file__, "-s"])
@@ -1,19 +1,22 @@
-import asyncio
-from dotenv import load_dotenv
-load_dotenv()
+import os
 
-from memory import memorygate
+import pytest
 
-async def main():
-    await memorygate.initialize()
-    
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not os.environ.get("GOOGLE_API_KEY"), reason="GOOGLE_API_KEY not set"),
+]
+
+
+async def test_memory_retrieval(mg):
     # Store some interaction
-    await memorygate.process("test_123", "Remind me I love chocolate", "Got it, chocolate is your favorite.")
+    await mg.process("test_123", "Remind me I love chocolate", "Got it, chocolate is your favorite.")
 
     # fetch context
-    ctx = await memorygate.get_context("test_123")
-    print("CONTEXT:")
-    print(ctx)
+    ctx = await mg.get_context("test_123")
+    assert "## Recent Conversation History" in ctx
+    assert "- **User**: Remind me I love chocolate" in ctx
+    assert "- **Assistant**: Got it, chocolate is your favorite." in ctx
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    pytest.main([__file__, "-s"])
@@ -0,0 +1,41 @@
+import pytest
+
+from interfaces.telegram import _utf16_chunks
+
+
+def _units(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+def test_short_text_is_returned_whole():
+    text = "hello 👋"
+    assert _utf16_chunks(text, limit=16) == [text]
+
+
+def test_prefers_newline_then_space():
+    assert _utf16_chunks("one two\nthree four", limit=12) == ["one two\n", "three four"]
+    assert _utf16_chunks("alpha beta gamma", limit=12) == ["alpha beta ", "gamma"]
+
+
+def test_hard_cut_without_separator():
+    assert _utf16_chunks("abcdefghij", limit=4) == ["abcd", "efgh", "ij"]
+
+
+def test_astral_character_at_the_limit_is_not_split():
+    # "😀" is two UTF-16 units; the fifth unit boundary falls inside it
+    text = "abcd😀efgh😀"
+    chunks = _utf16_chunks(text, limit=5)
+    assert "".join(chunks) == text
+    assert all(_units(chunk) <= 5 for chunk in chunks)
+    assert chunks[0] == "abcd"
+    assert chunks[1].startswith("😀")
+
+
+def test_only_astral_characters_at_minimum_limit():
+    text = "😀" * 5
+    assert _utf16_chunks(text, limit=2) == ["😀"] * 5
+
+
+def test_rejects_limit_below_two():
+    with pytest.raises(ValueError):
+        _utf16_chunks("😀😀", limit=1)